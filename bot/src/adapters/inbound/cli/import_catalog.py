@@ -0,0 +1,88 @@
+"""Import courses, subjects and notes from a CSV or JSONL file.
+
+    python -m src.adapters.inbound.cli.import_catalog catalog.csv
+
+CSV files need a header with `year,subject[,note]` columns; JSONL files one object per
+line with the same keys. Rows are streamed, so the file is never loaded into memory whole.
+Malformed rows are skipped and reported with their line numbers, the rest is imported.
+"""
+import argparse
+import csv
+import json
+import pathlib
+import sys
+from collections.abc import Iterator
+
+from src.adapters.outbound.persistence.course_repository import SqlModelCourseRepository
+from src.core.application.services.import_catalog import CatalogRow, ImportCatalogService
+from src.core.domain.common.enums import CourseYear
+from src.infrastructure.database import create_db_and_tables, get_session
+
+
+def parse_row(record: object) -> CatalogRow:
+    """Raises KeyError, TypeError or ValueError for a malformed record"""
+    if not isinstance(record, dict):
+        raise ValueError("not an object")
+    subject = record["subject"]
+    if not isinstance(subject, str) or not subject.strip():
+        raise ValueError(f"invalid subject {subject!r}")
+    return CatalogRow(year=CourseYear(int(record["year"])), subject=subject, note=record.get("note") or None)
+
+
+def read_csv(path: pathlib.Path, rejected: list[str]) -> Iterator[CatalogRow]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for record in reader:
+            try:
+                yield parse_row(record)
+            except (KeyError, TypeError, ValueError) as error:
+                rejected.append(f"line {reader.line_num}: {_describe(error)}")
+
+
+def read_jsonl(path: pathlib.Path, rejected: list[str]) -> Iterator[CatalogRow]:
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield parse_row(json.loads(line))
+            except (KeyError, TypeError, ValueError) as error:
+                rejected.append(f"line {line_number}: {_describe(error)}")
+
+
+def _describe(error: Exception) -> str:
+    return f"missing column {error}" if isinstance(error, KeyError) else str(error)
+
+
+READERS = {
+    ".csv": read_csv,
+    ".jsonl": read_jsonl,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import catalog of courses, subjects and notes")
+    parser.add_argument("path", type=pathlib.Path, help="CSV or JSONL file")
+    args = parser.parse_args()
+
+    reader = READERS.get(args.path.suffix.lower())
+    if reader is None:
+        parser.error(f"Unsupported file type {args.path.suffix!r}, expected one of {', '.join(READERS)}")
+
+    create_db_and_tables()
+    service = ImportCatalogService(SqlModelCourseRepository(get_session))
+    rejected = []
+    report = service.import_rows(reader(args.path, rejected))
+
+    for reason in rejected:
+        print(f"Skipped {reason}", file=sys.stderr)
+
+    print(
+        f"Imported {report.rows} rows in {report.elapsed_seconds:.2f}s ({report.rows_per_second:.0f} rows/s): "
+        f"{report.courses_created} courses, {report.subjects_created} subjects, {report.notes_created} notes created, "
+        f"{report.duplicates} duplicates skipped, {len(rejected)} malformed rows skipped"
+    )
+
+
+if __name__ == "__main__":
+    main()
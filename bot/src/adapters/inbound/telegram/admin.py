@@ -0,0 +1,144 @@
+import asyncio
+import uuid
+
+from telegram import Update
+from telegram.ext import BaseHandler, CommandHandler, ContextTypes, filters
+
+from src.adapters.outbound.telegram.send_scheduler import TelegramSendScheduler
+from src.core.application.exceptions import (
+    EmptyWelcomeMessageError,
+    NoteFileMissingError,
+    ObjectNotFoundError,
+    ReceiptNotFoundError,
+    SubjectNotFoundError,
+    SubmissionAlreadyModeratedError,
+    SubmissionNotFoundError,
+)
+from src.core.application.services.admin_confirm import AdminConfirmService
+from src.core.application.services.admin_list_pending import AdminListPendingService
+from src.core.application.services.admin_release import AdminReleaseService
+from src.core.application.services.admin_update_welcome import AdminUpdateWelcomeService
+
+
+RELEASE_FAILURE_REASONS = {
+    ReceiptNotFoundError: "чек не найден",
+    NoteFileMissingError: "у конспекта нет файла",
+    ObjectNotFoundError: "файл отсутствует в хранилище",
+}
+# Keeps the batch report within Telegram's message length limit
+REPORT_FAILURES_LIMIT = 50
+
+
+class AdminHandler:
+    """Commands available to the admin chat only"""
+
+    def __init__(
+        self,
+        admin_id: int,
+        update_welcome_service: AdminUpdateWelcomeService,
+        release_service: AdminReleaseService,
+        list_pending_service: AdminListPendingService,
+        confirm_service: AdminConfirmService,
+        send_scheduler: TelegramSendScheduler,
+    ):
+        self._admin_filter = filters.User(user_id=admin_id)
+        self._update_welcome_service = update_welcome_service
+        self._release_service = release_service
+        self._list_pending_service = list_pending_service
+        self._confirm_service = confirm_service
+        self._send_scheduler = send_scheduler
+
+    def handlers(self) -> list[BaseHandler]:
+        return [
+            CommandHandler("set_welcome", self.set_welcome, filters=self._admin_filter),
+            CommandHandler("release", self.release, filters=self._admin_filter),
+            CommandHandler("list_pending", self.list_pending, filters=self._admin_filter),
+            CommandHandler("confirm", self.confirm, filters=self._admin_filter),
+        ]
+
+    async def set_welcome(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        # Everything after the command, keeping the admin's line breaks
+        text = update.message.text.partition(" ")[2]
+
+        try:
+            self._update_welcome_service.update(text)
+            reply = "Приветственное сообщение обновлено."
+        except EmptyWelcomeMessageError:
+            reply = "Использование: /set_welcome <текст>"
+
+        await self._send_scheduler.submit(update.effective_chat.id, lambda: update.message.reply_text(reply))
+
+    async def release(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """/release <receipt_id> [<receipt_id> ...]"""
+        try:
+            receipt_ids = [uuid.UUID(arg) for arg in context.args]
+        except ValueError:
+            receipt_ids = []
+
+        if not receipt_ids:
+            reply = "Использование: /release <receipt_id> [<receipt_id> ...]"
+        elif len(receipt_ids) == 1:
+            (result,) = await self._release_service.release_many(receipt_ids)
+            reply = "Файл отправлен пользователю." if result.ok else f"{_failure_reason(result.error).capitalize()}."
+        else:
+            results = await self._release_service.release_many(receipt_ids)
+            failed = [result for result in results if not result.ok]
+
+            lines = [f"Отправлено: {len(results) - len(failed)} из {len(results)}."]
+            lines += [f"{result.receipt_id}: {_failure_reason(result.error)}" for result in failed[:REPORT_FAILURES_LIMIT]]
+            if len(failed) > REPORT_FAILURES_LIMIT:
+                lines.append(f"…и ещё {len(failed) - REPORT_FAILURES_LIMIT}")
+            reply = "\n".join(lines)
+
+        await self._send_scheduler.submit(update.effective_chat.id, lambda: update.message.reply_text(reply))
+
+    async def list_pending(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """/list_pending [<after_submission_id>]"""
+        try:
+            after = uuid.UUID(context.args[0]) if context.args else None
+        except ValueError:
+            after = None
+
+        submissions, next_cursor = await asyncio.to_thread(self._list_pending_service.list_pending, after)
+
+        if not submissions:
+            reply = "Очередь пустая."
+        else:
+            lines = ["Ожидают проверки:"]
+            lines += [f"{submission.id} — {submission.title} ({submission.uploader_name})" for submission in submissions]
+            if next_cursor:
+                lines.append(f"Дальше: /list_pending {next_cursor}")
+            reply = "\n".join(lines)
+
+        await self._send_scheduler.submit(update.effective_chat.id, lambda: update.message.reply_text(reply))
+
+    async def confirm(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """/confirm <submission_id>"""
+        try:
+            submission_id = uuid.UUID(context.args[0]) if len(context.args) == 1 else None
+        except ValueError:
+            submission_id = None
+
+        if submission_id is None:
+            reply = "Использование: /confirm <submission_id>"
+        else:
+            try:
+                subject, note = await asyncio.to_thread(self._confirm_service.publish, submission_id)
+                # Back on the event loop: the search index and keyboards are read here without locking
+                self._confirm_service.notify(subject, note)
+                reply = f"Конспект «{note.title}» опубликован."
+            except SubmissionNotFoundError:
+                reply = "Заявка не найдена."
+            except SubmissionAlreadyModeratedError:
+                reply = "Заявка уже обработана."
+            except SubjectNotFoundError:
+                reply = "Предмет заявки не найден."
+
+        await self._send_scheduler.submit(update.effective_chat.id, lambda: update.message.reply_text(reply))
+
+
+def _failure_reason(error: Exception) -> str:
+    for error_type, reason in RELEASE_FAILURE_REASONS.items():
+        if isinstance(error, error_type):
+            return reason
+    return f"не удалось отправить ({error})"
\ No newline at end of file
@@ -0,0 +1,29 @@
+from collections.abc import Awaitable, Callable
+
+from telegram.ext import Application, ApplicationBuilder
+
+
+def build_application(
+    token: str,
+    concurrent_updates: int,
+    polling: bool,
+    post_init: Callable[[Application], Awaitable[None]] | None = None,
+    post_stop: Callable[[Application], Awaitable[None]] | None = None,
+) -> Application:
+    """PTB application shared by both inbound modes; handlers are added by the caller.
+
+    Updates are processed concurrently, up to `concurrent_updates` at a time, so one slow
+    handler (a file upload, a DB write) does not hold back everybody else's taps. Webhook
+    mode needs no updater: updates arrive through `webhook.create_webhook_app`.
+    `post_init` runs on the bot's event loop before the first update is processed, `post_stop`
+    once no more updates are processed, before the bot's connections close.
+    """
+    builder = ApplicationBuilder().token(token).concurrent_updates(concurrent_updates)
+    if not polling:
+        builder = builder.updater(None)
+    if post_init:
+        builder = builder.post_init(post_init)
+    if post_stop:
+        builder = builder.post_stop(post_stop)
+
+    return builder.build()
@@ -0,0 +1,86 @@
+import asyncio
+import uuid
+
+from telegram import InlineKeyboardMarkup, Update
+from telegram.ext import BaseHandler, CallbackQueryHandler, ContextTypes
+
+from src.adapters.outbound.telegram.send_scheduler import TelegramSendScheduler
+from src.core.application.exceptions import ReceiptJournalFullError
+from src.core.application.services.buy_notes import BuyNotesService
+from .callback_codec import CallbackAction, CallbackCodec
+from .keyboards import NOTES_MENU_TEXT, CatalogKeyboards
+
+
+BUY_ACTIONS = {CallbackAction.BUY_SUBJECT, CallbackAction.BUY_NOTE}
+
+
+class BuyHandler:
+    """Buying a note: pick one of the subject's notes and get the payment details, recorded as a receipt"""
+
+    def __init__(
+        self,
+        buy_service: BuyNotesService,
+        keyboards: CatalogKeyboards,
+        codec: CallbackCodec,
+        send_scheduler: TelegramSendScheduler,
+        payment_details: str,
+        price_rub: int,
+    ):
+        self._buy_service = buy_service
+        self._keyboards = keyboards
+        self._codec = codec
+        self._send_scheduler = send_scheduler
+        self._payment_details = payment_details
+        self._price_rub = price_rub
+
+    def handlers(self) -> list[BaseHandler]:
+        return [CallbackQueryHandler(self.route, pattern=self._is_buy_callback)]
+
+    def _is_buy_callback(self, data: object) -> bool:
+        callback = self._codec.decode(data) if isinstance(data, str) else None
+        return callback is not None and callback.action in BUY_ACTIONS
+
+    async def route(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        query = update.callback_query
+        callback = self._codec.decode(query.data)
+        await query.answer()
+
+        if callback.action == CallbackAction.BUY_NOTE:
+            await self._purchase(update, callback.payload)
+            return
+
+        subject = self._keyboards.subject(callback.payload)
+        if subject is None or not subject.notes:
+            await self._edit(update, "По этому предмету конспекта пока нет.")
+        elif len(subject.notes) == 1:
+            await self._purchase(update, subject.notes[0].id)
+        else:
+            await self._edit(update, NOTES_MENU_TEXT, self._keyboards.notes_menu(subject))
+
+    async def _purchase(self, update: Update, note_id: uuid.UUID) -> None:
+        user = update.effective_user
+        # A cache miss reads the note from the database synchronously
+        try:
+            receipt = await asyncio.to_thread(
+                self._buy_service.create_purchase_receipt,
+                user.id, user.full_name, self._payment_details, self._price_rub, note_id,
+            )
+        except ReceiptJournalFullError:
+            await self._edit(update, "Не удалось оформить покупку, попробуйте позже.")
+            return
+
+        if receipt is None:
+            await self._edit(update, "Этот конспект больше не доступен.")
+            return
+
+        await self._edit(
+            update,
+            f"Для покупки конспекта «{receipt.note.title}»:\n{self._payment_details}\n\n"
+            f"Номер заказа: {receipt.id}\n"
+            "Пожалуйста, оплатите, укажите номер заказа в комментарии к платежу и дождитесь проверки (до 3 часов).",
+        )
+
+    async def _edit(self, update: Update, text: str, markup: InlineKeyboardMarkup | None = None) -> None:
+        await self._send_scheduler.submit(
+            update.effective_chat.id, lambda: update.callback_query.edit_message_text(text, reply_markup=markup)
+        )
\ No newline at end of file
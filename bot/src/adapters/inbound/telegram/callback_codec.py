@@ -0,0 +1,88 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import uuid
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+# Telegram rejects buttons whose callback_data is longer than this many bytes
+CALLBACK_DATA_LIMIT = 64
+
+
+class CallbackAction(IntEnum):
+    MAIN_MENU = 1
+    BUY_COURSES = 2
+    SELL_COURSES = 3
+    BUY_SUBJECTS = 4
+    SELL_SUBJECTS = 5
+    BUY_SUBJECT = 6
+    SELL_SUBJECT = 7
+    BUY_NOTE = 8
+
+
+@dataclass(frozen=True, slots=True)
+class Callback:
+    action: CallbackAction
+    # Entity id (16 bytes on the wire) or a small number such as a course year (1 byte)
+    payload: uuid.UUID | int | None = None
+
+
+class CallbackCodec:
+    """Packs an action and its payload into `callback_data`, so buttons need no server-side state.
+
+    Layout before base64url: action byte, payload (none, 1 byte or 16 raw UUID bytes),
+    then the first `tag_size` bytes of an HMAC-SHA256 over both. A subject button takes
+    34 characters. Data that fails the tag check was not issued with this secret (forged,
+    or from before a secret rotation) and decodes to None.
+    """
+
+    def __init__(self, secret: bytes, tag_size: int = 8):
+        if not secret:
+            raise ValueError("Callback codec requires a secret")
+
+        self._secret = secret
+        self._tag_size = tag_size
+
+    def encode(self, action: CallbackAction, payload: uuid.UUID | int | None = None) -> str:
+        if payload is None:
+            body = bytes((action,))
+        elif isinstance(payload, uuid.UUID):
+            body = bytes((action,)) + payload.bytes
+        else:
+            body = bytes((action, payload))
+
+        data = base64.urlsafe_b64encode(body + self._tag(body)).rstrip(b"=").decode()
+        if len(data) > CALLBACK_DATA_LIMIT:
+            raise ValueError(f"Callback data is {len(data)} bytes, Telegram allows {CALLBACK_DATA_LIMIT}")
+
+        return data
+
+    def decode(self, data: str) -> Callback | None:
+        try:
+            raw = base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+        except (binascii.Error, ValueError):
+            return None
+
+        body, tag = raw[:-self._tag_size], raw[-self._tag_size:]
+        if not body or not hmac.compare_digest(tag, self._tag(body)):
+            return None
+
+        try:
+            action = CallbackAction(body[0])
+        except ValueError:
+            return None
+
+        match len(body) - 1:
+            case 0:
+                return Callback(action)
+            case 1:
+                return Callback(action, body[1])
+            case 16:
+                return Callback(action, uuid.UUID(bytes=body[1:]))
+            case _:
+                return None
+
+    def _tag(self, body: bytes) -> bytes:
+        return hmac.new(self._secret, body, hashlib.sha256).digest()[:self._tag_size]
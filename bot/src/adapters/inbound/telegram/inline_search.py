@@ -0,0 +1,39 @@
+from telegram import InlineQueryResultArticle, InputTextMessageContent, Update
+from telegram.ext import ContextTypes, InlineQueryHandler
+
+from src.core.application.services.search_catalog import SearchCatalogService
+from src.core.domain.services.title_index import EntryKind, SearchEntry
+
+
+class InlineSearchHandler:
+    """Answers `@bot <query>` with matching subjects and notes from the in-memory index"""
+
+    def __init__(self, search_service: SearchCatalogService, limit: int = 20, cache_time: int = 60):
+        self._search_service = search_service
+        self._limit = limit
+        self._cache_time = cache_time
+
+    def handler(self) -> InlineQueryHandler:
+        return InlineQueryHandler(self.answer)
+
+    async def answer(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        entries = self._search_service.search(update.inline_query.query, self._limit)
+
+        await update.inline_query.answer(
+            [self._to_result(entry) for entry in entries],
+            cache_time=self._cache_time,
+        )
+
+    @staticmethod
+    def _to_result(entry: SearchEntry) -> InlineQueryResultArticle:
+        if entry.kind == EntryKind.SUBJECT:
+            title, description, text = f"📚 {entry.title}", "Предмет", f"📚 {entry.title}"
+        else:
+            title, description, text = f"📄 {entry.title}", entry.subject_name, f"📄 {entry.title}\nПредмет: {entry.subject_name}"
+
+        return InlineQueryResultArticle(
+            id=entry.id.hex,
+            title=title,
+            description=description,
+            input_message_content=InputTextMessageContent(text),
+        )
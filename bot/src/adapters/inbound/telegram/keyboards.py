@@ -0,0 +1,141 @@
+import threading
+import uuid
+from dataclasses import replace
+from enum import StrEnum
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from src.core.application.ports.outbound.catalog_listener import CatalogListener
+from src.core.application.ports.outbound.persistence import CourseRepository
+from src.core.domain.common.enums import CourseYear, StartActions
+from src.core.domain.models import Course, Note, Subject
+from .callback_codec import CallbackAction, CallbackCodec
+
+
+class MenuPurpose(StrEnum):
+    BUY = "buy"
+    SELL = "sell"
+
+
+COURSES_ACTION = {MenuPurpose.BUY: CallbackAction.BUY_COURSES, MenuPurpose.SELL: CallbackAction.SELL_COURSES}
+SUBJECTS_ACTION = {MenuPurpose.BUY: CallbackAction.BUY_SUBJECTS, MenuPurpose.SELL: CallbackAction.SELL_SUBJECTS}
+SUBJECT_ACTION = {MenuPurpose.BUY: CallbackAction.BUY_SUBJECT, MenuPurpose.SELL: CallbackAction.SELL_SUBJECT}
+START_ACTION_PURPOSE = {StartActions.BUY: MenuPurpose.BUY, StartActions.SELL: MenuPurpose.SELL}
+
+SUBJECTS_MENU_TEXT = "Выберите предмет:\n(✅ — есть конспект, ❌ — нет)"
+NOTES_MENU_TEXT = "Выберите конспект:"
+COURSES_MENU_TEXT = {
+    MenuPurpose.BUY: "Выберите курс:",
+    MenuPurpose.SELL: "Выберите курс, по которому хотите продать конспект:",
+}
+
+
+class CatalogKeyboards(CatalogListener):
+    """Course and subject menus prebuilt from a catalog snapshot and served from memory.
+
+    `rebuild` renders every (course, purpose) menu from one `list_all`; afterwards a tap
+    costs no database queries. A confirmed note re-renders only the menus of its course.
+    Markup objects are immutable, so the same menu is shared by all chats.
+    """
+
+    def __init__(self, course_repository: CourseRepository, codec: CallbackCodec):
+        self._course_repository = course_repository
+        self._codec = codec
+        self.main_menu = InlineKeyboardMarkup([
+            [InlineKeyboardButton(action.value, callback_data=self._start_callback(action))] for action in StartActions
+        ])
+        self._lock = threading.Lock()
+        self._courses: dict[CourseYear, Course] = {}
+        self._course_by_subject: dict[uuid.UUID, CourseYear] = {}
+        self._courses_menus: dict[MenuPurpose, InlineKeyboardMarkup] = {}
+        self._subjects_menus: dict[tuple[CourseYear, MenuPurpose], InlineKeyboardMarkup] = {}
+
+    def rebuild(self) -> None:
+        courses = {course.year: course for course in self._course_repository.list_all()}
+
+        with self._lock:
+            self._courses = courses
+            self._course_by_subject = {subject.id: course.year for course in courses.values() for subject in course.subjects}
+            self._courses_menus = {purpose: self._render_courses(purpose) for purpose in MenuPurpose}
+            self._subjects_menus = {
+                (year, purpose): self._render_subjects(course, purpose)
+                for year, course in courses.items()
+                for purpose in MenuPurpose
+            }
+
+    def courses_menu(self, purpose: MenuPurpose) -> InlineKeyboardMarkup:
+        return self._courses_menus[purpose]
+
+    def subjects_menu(self, year: CourseYear, purpose: MenuPurpose) -> InlineKeyboardMarkup | None:
+        """None when the course has no subjects"""
+        return self._subjects_menus.get((year, purpose))
+
+    def subject(self, subject_id: uuid.UUID) -> Subject | None:
+        """The subject with its notes as of the last render"""
+        year = self._course_by_subject.get(subject_id)
+        if year is None:
+            return None
+
+        return next((subject for subject in self._courses[year].subjects if subject.id == subject_id), None)
+
+    def notes_menu(self, subject: Subject) -> InlineKeyboardMarkup:
+        # Rendered per request: only subjects with several notes get here
+        buttons = [
+            [InlineKeyboardButton(note.title, callback_data=self._codec.encode(CallbackAction.BUY_NOTE, note.id))]
+            for note in subject.notes
+        ]
+        buttons.append(self._back_button(SUBJECTS_ACTION[MenuPurpose.BUY], self._course_by_subject[subject.id].value))
+
+        return InlineKeyboardMarkup(buttons)
+
+    def note_saved(self, subject: Subject, note: Note) -> None:
+        with self._lock:
+            year = self._course_by_subject.get(subject.id)
+            if year is None:
+                return
+
+            course = self._courses[year]
+            subjects = tuple(
+                replace(known, notes=(*known.notes, note))
+                if known.id == subject.id and all(existing.id != note.id for existing in known.notes)
+                else known
+                for known in course.subjects
+            )
+            course = replace(course, subjects=subjects)
+
+            self._courses[year] = course
+            for purpose in MenuPurpose:
+                self._subjects_menus[(year, purpose)] = self._render_subjects(course, purpose)
+
+    def _start_callback(self, action: StartActions) -> str:
+        purpose = START_ACTION_PURPOSE.get(action)
+        # "О нас" has no menu of its own yet and leads back to the main menu
+        return self._codec.encode(COURSES_ACTION[purpose] if purpose else CallbackAction.MAIN_MENU)
+
+    def _back_button(self, action: CallbackAction, payload: int | None = None) -> list[InlineKeyboardButton]:
+        return [InlineKeyboardButton("◀️ Назад", callback_data=self._codec.encode(action, payload))]
+
+    def _render_courses(self, purpose: MenuPurpose) -> InlineKeyboardMarkup:
+        buttons = [
+            [InlineKeyboardButton(f"{year.value} курс", callback_data=self._codec.encode(SUBJECTS_ACTION[purpose], year.value))]
+            for year in sorted(self._courses, key=lambda year: year.value)
+            if self._courses[year].subjects
+        ]
+        buttons.append(self._back_button(CallbackAction.MAIN_MENU))
+
+        return InlineKeyboardMarkup(buttons)
+
+    def _render_subjects(self, course: Course, purpose: MenuPurpose) -> InlineKeyboardMarkup | None:
+        if not course.subjects:
+            return None
+
+        buttons = [
+            [InlineKeyboardButton(
+                f"{'✅' if subject.notes else '❌'} {subject.name}",
+                callback_data=self._codec.encode(SUBJECT_ACTION[purpose], subject.id),
+            )]
+            for subject in course.subjects
+        ]
+        buttons.append(self._back_button(COURSES_ACTION[purpose]))
+
+        return InlineKeyboardMarkup(buttons)
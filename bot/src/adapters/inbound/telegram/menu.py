@@ -0,0 +1,74 @@
+from telegram import InlineKeyboardMarkup, Update
+from telegram.ext import BaseHandler, CallbackQueryHandler, CommandHandler, ContextTypes
+
+from src.adapters.outbound.telegram.send_scheduler import TelegramSendScheduler
+from src.core.application.services.start_interaction import StartInteractionService
+from src.core.domain.common.enums import CourseYear
+from .callback_codec import CallbackAction, CallbackCodec
+from .keyboards import COURSES_MENU_TEXT, SUBJECTS_MENU_TEXT, CatalogKeyboards, MenuPurpose
+
+
+COURSES_PURPOSE = {CallbackAction.BUY_COURSES: MenuPurpose.BUY, CallbackAction.SELL_COURSES: MenuPurpose.SELL}
+SUBJECTS_PURPOSE = {CallbackAction.BUY_SUBJECTS: MenuPurpose.BUY, CallbackAction.SELL_SUBJECTS: MenuPurpose.SELL}
+MENU_ACTIONS = {CallbackAction.MAIN_MENU, *COURSES_PURPOSE, *SUBJECTS_PURPOSE}
+
+
+class MenuHandler:
+    """/start and navigation between the main, course and subject menus, served from `CatalogKeyboards`"""
+
+    def __init__(
+        self,
+        start_service: StartInteractionService,
+        keyboards: CatalogKeyboards,
+        codec: CallbackCodec,
+        send_scheduler: TelegramSendScheduler,
+    ):
+        self._start_service = start_service
+        self._keyboards = keyboards
+        self._codec = codec
+        self._send_scheduler = send_scheduler
+
+    def handlers(self) -> list[BaseHandler]:
+        return [
+            CommandHandler("start", self.start),
+            CallbackQueryHandler(self.route, pattern=self._is_menu_callback),
+        ]
+
+    def _is_menu_callback(self, data: object) -> bool:
+        """Menu navigation, plus data that fails to decode so stale buttons get an answer"""
+        callback = self._codec.decode(data) if isinstance(data, str) else None
+        return callback is None or callback.action in MENU_ACTIONS
+
+    async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        message = self._start_service.get_start_data()["message"]
+        await self._send_scheduler.submit(
+            update.effective_chat.id, lambda: update.message.reply_text(message, reply_markup=self._keyboards.main_menu)
+        )
+
+    async def route(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        query = update.callback_query
+        callback = self._codec.decode(query.data or "")
+
+        if callback is None:
+            await query.answer("Кнопка устарела — пожалуйста, повторите действие.", show_alert=True)
+            return
+
+        await query.answer()
+
+        if callback.action == CallbackAction.MAIN_MENU:
+            await self._edit(update, self._start_service.get_start_data()["message"], self._keyboards.main_menu)
+        elif callback.action in COURSES_PURPOSE:
+            purpose = COURSES_PURPOSE[callback.action]
+            await self._edit(update, COURSES_MENU_TEXT[purpose], self._keyboards.courses_menu(purpose))
+        elif callback.action in SUBJECTS_PURPOSE:
+            markup = self._keyboards.subjects_menu(CourseYear(callback.payload), SUBJECTS_PURPOSE[callback.action])
+            if markup is None:
+                await self._edit(update, "Нет предметов в этом курсе.")
+            else:
+                await self._edit(update, SUBJECTS_MENU_TEXT, markup)
+
+    async def _edit(self, update: Update, text: str, markup: InlineKeyboardMarkup | None = None) -> None:
+        # Answering the callback query is not rate limited, editing the message is
+        await self._send_scheduler.submit(
+            update.effective_chat.id, lambda: update.callback_query.edit_message_text(text, reply_markup=markup)
+        )
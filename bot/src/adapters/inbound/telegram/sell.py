@@ -0,0 +1,105 @@
+import asyncio
+import pathlib
+import uuid
+
+from telegram import Update
+from telegram.ext import BaseHandler, CallbackQueryHandler, ContextTypes, MessageHandler, filters
+
+from src.adapters.outbound.telegram.file_download import iter_file_chunks
+from src.adapters.outbound.telegram.send_scheduler import TelegramSendScheduler
+from src.core.application.exceptions import NotAPdfError, SubjectNotFoundError, UploadTooLargeError
+from src.core.application.ports.outbound.persistence import ConversationStateStore
+from src.core.application.services.sell_notes import SellNotesService
+from .callback_codec import CallbackAction, CallbackCodec
+
+
+# Keys of the conversation state between the steps of a sale
+SELL_SUBJECT_KEY = "sell_subject"
+SELL_FILE_KEY = "sell_file"
+SELL_TITLE_KEY = "sell_title"
+
+
+class SellHandler:
+    """Selling a note: pick a subject, upload the PDF, then send payment details"""
+
+    def __init__(
+        self,
+        sell_service: SellNotesService,
+        codec: CallbackCodec,
+        send_scheduler: TelegramSendScheduler,
+        state_store: ConversationStateStore,
+    ):
+        self._sell_service = sell_service
+        self._codec = codec
+        self._send_scheduler = send_scheduler
+        self._state_store = state_store
+
+    def handlers(self) -> list[BaseHandler]:
+        return [
+            CallbackQueryHandler(self.choose_subject, pattern=self._is_sell_callback),
+            MessageHandler(filters.ChatType.PRIVATE & filters.Document.ALL, self.upload),
+            MessageHandler(filters.ChatType.PRIVATE & filters.TEXT & ~filters.COMMAND, self.payment_details),
+        ]
+
+    def _is_sell_callback(self, data: object) -> bool:
+        callback = self._codec.decode(data) if isinstance(data, str) else None
+        return callback is not None and callback.action == CallbackAction.SELL_SUBJECT
+
+    async def choose_subject(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        query = update.callback_query
+        await query.answer()
+
+        subject_id = self._codec.decode(query.data).payload
+        self._state_store.set(update.effective_user.id, {SELL_SUBJECT_KEY: str(subject_id)})
+
+        await self._reply(update, "Отправьте PDF конспекта (только .pdf). После файла отправьте свои реквизиты сообщением.")
+
+    async def upload(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        state = self._state_store.get(update.effective_user.id)
+        if state is None or SELL_SUBJECT_KEY not in state:
+            await self._reply(update, "Я не ожидал файл. Начните /start и выберите 'Продать'.")
+            return
+
+        document = update.message.document
+        try:
+            stored = await self._sell_service.upload(
+                iter_file_chunks(context.bot, document.file_id), declared_size=document.file_size
+            )
+        except UploadTooLargeError:
+            await self._reply(update, "Файл слишком большой.")
+            return
+        except NotAPdfError:
+            await self._reply(update, "Пожалуйста, отправьте файл в формате PDF.")
+            return
+
+        title = pathlib.Path(document.file_name or "").stem or "Конспект"
+        self._state_store.set(update.effective_user.id, {**state, SELL_FILE_KEY: stored.key, SELL_TITLE_KEY: title})
+
+        await self._reply(
+            update,
+            "Файл сохранён в очередь на проверку. Теперь, пожалуйста, отправьте сообщение с вашими реквизитами для оплаты (текст).",
+        )
+
+    async def payment_details(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        user = update.effective_user
+        state = self._state_store.get(user.id)
+        if state is None or SELL_FILE_KEY not in state:
+            return
+
+        subject_id = uuid.UUID(state[SELL_SUBJECT_KEY])
+        try:
+            # The service talks to the database synchronously
+            await asyncio.to_thread(
+                self._sell_service.submit,
+                user.id, user.full_name, subject_id, state[SELL_TITLE_KEY], update.message.text, state[SELL_FILE_KEY],
+            )
+            reply = "Спасибо — ваш файл ожидает ручной проверки. Администратор получит уведомление."
+        except SubjectNotFoundError:
+            reply = "Предмет больше не доступен. Пожалуйста, начните заново."
+
+        self._state_store.delete(user.id)
+
+        await self._reply(update, reply)
+
+    async def _reply(self, update: Update, text: str) -> None:
+        await self._send_scheduler.submit(update.effective_chat.id, lambda: update.effective_message.reply_text(text))
\ No newline at end of file
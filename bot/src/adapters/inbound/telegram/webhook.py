@@ -0,0 +1,89 @@
+import contextlib
+import hmac
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from telegram import Update
+from telegram.ext import Application
+
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+logger = logging.getLogger(__name__)
+
+
+def create_webhook_app(
+    application: Application,
+    secret_token: str,
+    path: str,
+    webhook_url: str | None = None,
+    stats: Callable[[], dict[str, Any]] | None = None,
+) -> FastAPI:
+    """ASGI app that receives updates pushed by Telegram and hands them to `application`.
+
+    Requests must carry the secret token Telegram was given in `set_webhook`; anything else
+    is rejected before the body is parsed. The endpoint only enqueues the update and answers
+    200 right away, handlers run concurrently in the application (see `build_application`).
+    When `webhook_url` is set, the webhook is registered with Telegram on startup.
+    `stats`, if given, is served as JSON on GET /stats to requests carrying the same secret token.
+    """
+    if not secret_token:
+        raise ValueError("Webhook mode requires a secret token")
+
+    expected_token = secret_token.encode()
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI):
+        async with application:
+            # post_init and post_stop are called by run_polling in polling mode, here it is up to us
+            if application.post_init:
+                await application.post_init(application)
+            if webhook_url:
+                await application.bot.set_webhook(
+                    webhook_url + path,
+                    secret_token=secret_token,
+                    allowed_updates=Update.ALL_TYPES,
+                )
+            await application.start()
+            yield
+            await application.stop()
+            if application.post_stop:
+                await application.post_stop(application)
+
+    app = FastAPI(lifespan=lifespan, docs_url=None, redoc_url=None, openapi_url=None)
+
+    def check_secret_token(request: Request) -> None:
+        received_token = request.headers.get(SECRET_TOKEN_HEADER, "").encode()
+        if not hmac.compare_digest(received_token, expected_token):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+    @app.post(path, status_code=status.HTTP_200_OK)
+    async def receive_update(request: Request) -> Response:
+        check_secret_token(request)
+
+        try:
+            data = await request.json()
+            if not isinstance(data, dict):
+                raise ValueError("Update must be a JSON object")
+            update = Update.de_json(data, application.bot)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            logger.warning("Rejected malformed update")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST)
+
+        await application.update_queue.put(update)
+        return Response(status_code=status.HTTP_200_OK)
+
+    @app.get("/healthz")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    if stats:
+        @app.get("/stats")
+        async def get_stats(request: Request) -> dict[str, Any]:
+            check_secret_token(request)
+            return stats()
+
+    return app
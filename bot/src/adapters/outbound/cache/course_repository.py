@@ -0,0 +1,66 @@
+import uuid
+from src.core.application.ports.outbound.persistence import CourseRepository
+from src.core.domain.models import Course
+from src.core.domain.common.enums import CourseYear
+from .ttl_cache import TaggedTTLCache
+from .tags import ALL_COURSES, course_tag, course_tags
+
+
+class CachedCourseRepository(CourseRepository):
+    def __init__(self, course_repository: CourseRepository, cache: TaggedTTLCache):
+        self._course_repository = course_repository
+        self._cache = cache
+
+    def get_by_id(self, course_id: uuid.UUID) -> Course | None:
+        key = ("course_by_id", course_id)
+        generation = self._cache.generation
+        course = self._cache.get(key)
+
+        if course is TaggedTTLCache.MISSING:
+            course = self._course_repository.get_by_id(course_id)
+            if course:
+                self._cache.set(key, course, course_tags(course), generation)
+
+        return course
+
+    def get_by_year(self, year: CourseYear) -> Course | None:
+        key = ("course_by_year", year)
+        generation = self._cache.generation
+        course = self._cache.get(key)
+
+        if course is TaggedTTLCache.MISSING:
+            course = self._course_repository.get_by_year(year)
+            if course:
+                self._cache.set(key, course, course_tags(course), generation)
+
+        return course
+
+    def list_all(self) -> list[Course]:
+        key = ("courses",)
+        generation = self._cache.generation
+        courses = self._cache.get(key)
+
+        if courses is TaggedTTLCache.MISSING:
+            courses = self._course_repository.list_all()
+            tags = {ALL_COURSES}
+            for course in courses:
+                tags |= course_tags(course)
+            self._cache.set(key, courses, tags, generation)
+
+        return list(courses)
+
+    def save(self, course: Course) -> None:
+        # Subjects and notes the new version drops are deleted too, and only the stored one knows them
+        stored = self._course_repository.get_by_id(course.id)
+        self._course_repository.save(course)
+        self._cache.invalidate(ALL_COURSES, *course_tags(course), *(course_tags(stored) if stored else ()))
+
+    def save_many(self, courses: list[Course]) -> None:
+        self._course_repository.save_many(courses)
+        self._cache.invalidate(ALL_COURSES, *(tag for course in courses for tag in course_tags(course)))
+
+    def delete(self, course_id: uuid.UUID) -> None:
+        # The course's subjects and notes go with it and may be cached on their own
+        stored = self._course_repository.get_by_id(course_id)
+        self._course_repository.delete(course_id)
+        self._cache.invalidate(ALL_COURSES, course_tag(course_id), *(course_tags(stored) if stored else ()))
@@ -0,0 +1,14 @@
+from src.core.application.ports.outbound.catalog_listener import CatalogListener
+from src.core.domain.models import Note, Subject
+from .ttl_cache import TaggedTTLCache
+from .tags import note_tag, subject_tag
+
+
+class CatalogCacheInvalidator(CatalogListener):
+    """Evicts cached aggregates on writes that bypass the cached repositories (e.g. a unit of work)"""
+
+    def __init__(self, cache: TaggedTTLCache):
+        self._cache = cache
+
+    def note_saved(self, subject: Subject, note: Note) -> None:
+        self._cache.invalidate(subject_tag(subject.id), note_tag(note.id))
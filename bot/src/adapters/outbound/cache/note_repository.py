@@ -0,0 +1,51 @@
+import uuid
+from src.core.application.ports.outbound.persistence import NoteRepository
+from src.core.domain.models import Note
+from .ttl_cache import TaggedTTLCache
+from .tags import note_tag, note_tags, subject_tag
+
+
+class CachedNoteRepository(NoteRepository):
+    def __init__(self, note_repository: NoteRepository, cache: TaggedTTLCache):
+        self._note_repository = note_repository
+        self._cache = cache
+
+    def get_by_id(self, note_id: uuid.UUID) -> Note | None:
+        key = ("note_by_id", note_id)
+        generation = self._cache.generation
+        note = self._cache.get(key)
+
+        if note is TaggedTTLCache.MISSING:
+            note = self._note_repository.get_by_id(note_id)
+            if note:
+                self._cache.set(key, note, note_tags(note), generation)
+
+        return note
+
+    def get_by_title(self, title: str) -> Note | None:
+        key = ("note_by_title", title)
+        generation = self._cache.generation
+        note = self._cache.get(key)
+
+        if note is TaggedTTLCache.MISSING:
+            note = self._note_repository.get_by_title(title)
+            if note:
+                self._cache.set(key, note, note_tags(note), generation)
+
+        return note
+
+    def save(self, note: Note) -> None:
+        self._note_repository.save(note)
+        self._cache.invalidate(note_tag(note.id))
+
+    def save_many(self, subject_id: uuid.UUID, notes: list[Note]) -> None:
+        self._note_repository.save_many(subject_id, notes)
+        self._cache.invalidate(subject_tag(subject_id), *(note_tag(note.id) for note in notes))
+
+    def set_telegram_file_id(self, note_id: uuid.UUID, telegram_file_id: str | None) -> None:
+        self._note_repository.set_telegram_file_id(note_id, telegram_file_id)
+        self._cache.invalidate(note_tag(note_id))
+
+    def delete(self, note_id: uuid.UUID) -> None:
+        self._note_repository.delete(note_id)
+        self._cache.invalidate(note_tag(note_id))
@@ -0,0 +1,52 @@
+import uuid
+from src.core.application.ports.outbound.persistence import SubjectRepository
+from src.core.domain.models import Subject
+from .ttl_cache import TaggedTTLCache
+from .tags import course_tag, subject_tag, subject_tags
+
+
+class CachedSubjectRepository(SubjectRepository):
+    def __init__(self, subject_repository: SubjectRepository, cache: TaggedTTLCache):
+        self._subject_repository = subject_repository
+        self._cache = cache
+
+    def get_by_id(self, subject_id: uuid.UUID) -> Subject | None:
+        key = ("subject_by_id", subject_id)
+        generation = self._cache.generation
+        subject = self._cache.get(key)
+
+        if subject is TaggedTTLCache.MISSING:
+            subject = self._subject_repository.get_by_id(subject_id)
+            if subject:
+                self._cache.set(key, subject, subject_tags(subject), generation)
+
+        return subject
+
+    def get_by_name(self, name: str) -> Subject | None:
+        key = ("subject_by_name", name)
+        generation = self._cache.generation
+        subject = self._cache.get(key)
+
+        if subject is TaggedTTLCache.MISSING:
+            subject = self._subject_repository.get_by_name(name)
+            if subject:
+                self._cache.set(key, subject, subject_tags(subject), generation)
+
+        return subject
+
+    def save(self, subject: Subject) -> None:
+        # Notes the new version drops are deleted too, and only the stored one knows them
+        stored = self._subject_repository.get_by_id(subject.id)
+        self._subject_repository.save(subject)
+        # New notes are only reachable through the subject tag, changed ones through their own
+        self._cache.invalidate(*subject_tags(subject), *(subject_tags(stored) if stored else ()))
+
+    def save_many(self, course_id: uuid.UUID, subjects: list[Subject]) -> None:
+        self._subject_repository.save_many(course_id, subjects)
+        self._cache.invalidate(course_tag(course_id), *(tag for subject in subjects for tag in subject_tags(subject)))
+
+    def delete(self, subject_id: uuid.UUID) -> None:
+        # The subject's notes go with it and may be cached on their own
+        stored = self._subject_repository.get_by_id(subject_id)
+        self._subject_repository.delete(subject_id)
+        self._cache.invalidate(subject_tag(subject_id), *(subject_tags(stored) if stored else ()))
@@ -0,0 +1,37 @@
+import uuid
+from collections.abc import Hashable
+
+from src.core.domain.models import Course, Note, Subject
+
+
+ALL_COURSES = ("courses",)
+
+
+def note_tag(note_id: uuid.UUID) -> Hashable:
+    return ("note", note_id)
+
+
+def subject_tag(subject_id: uuid.UUID) -> Hashable:
+    return ("subject", subject_id)
+
+
+def course_tag(course_id: uuid.UUID) -> Hashable:
+    return ("course", course_id)
+
+
+def note_tags(note: Note) -> set[Hashable]:
+    return {note_tag(note.id)}
+
+
+def subject_tags(subject: Subject) -> set[Hashable]:
+    tags = {subject_tag(subject.id)}
+    for note in subject.notes:
+        tags |= note_tags(note)
+    return tags
+
+
+def course_tags(course: Course) -> set[Hashable]:
+    tags = {course_tag(course.id)}
+    for subject in course.subjects:
+        tags |= subject_tags(subject)
+    return tags
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    tags: frozenset[Hashable] = field(default_factory=frozenset)
+
+
+class TaggedTTLCache:
+    """LRU cache with per-entry TTL and tag based invalidation.
+
+    Every entry is stored together with a set of tags (e.g. ids of the entities the value
+    was built from). `invalidate` drops every entry carrying any of the given tags, which
+    lets writers evict exactly the aggregates they affected.
+
+    A reader that misses and loads the value itself may finish after a writer has
+    invalidated it, and would put back the stale value it read. To prevent that, read
+    `generation` before loading and pass it to `set`: the value is dropped if anything was
+    invalidated in between.
+    """
+
+    MISSING = object()
+
+    def __init__(self, max_size: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._keys_by_tag: dict[Hashable, set[Hashable]] = {}
+        self._stats = CacheStats()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Bumped by every `invalidate` and `clear`"""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Any:
+        """Return cached value or `TaggedTTLCache.MISSING`"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._stats.misses += 1
+                return self.MISSING
+
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return self.MISSING
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[Hashable] = (), generation: int | None = None) -> None:
+        """Cache `value`, unless `generation` is given and something was invalidated since"""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            entry = _Entry(value=value, expires_at=self._clock() + self._ttl_seconds, tags=frozenset(tags))
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self._max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._stats.evictions += 1
+
+    def invalidate(self, *tags: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in self._keys_by_tag.get(tag, set()).copy():
+                    self._remove(key)
+                    self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                size=len(self._entries),
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
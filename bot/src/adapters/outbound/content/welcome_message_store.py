@@ -0,0 +1,71 @@
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+
+import watchfiles
+
+from src.core.application.ports.outbound.welcome_message_store import WelcomeMessageStore
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileWelcomeMessageStore(WelcomeMessageStore):
+    """Welcome message kept in a text file and served from memory.
+
+    `get` never touches the disk. The file is read once on creation and again only when
+    `watch` sees it change, so it can still be edited by hand on a running bot. `set` writes
+    a temp file next to it and renames it over the old one, so readers never see a half
+    written message, and updates the in-memory copy right away.
+    """
+
+    def __init__(self, path: pathlib.Path, default: str):
+        self._path = path
+        self._default = default
+        self._lock = threading.Lock()
+        self._text = self._read()
+
+    def get(self) -> str:
+        return self._text
+
+    def set(self, text: str) -> None:
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp")
+
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self._path)
+            except BaseException:
+                pathlib.Path(temp_path).unlink(missing_ok=True)
+                raise
+
+            self._text = text
+
+    def reload(self) -> None:
+        with self._lock:
+            self._text = self._read()
+
+    def watch(self, stop_event: threading.Event | None = None) -> None:
+        """Reload on changes to the file until `stop_event` is set; blocks, run it in a thread.
+
+        The directory is watched rather than the file: an atomic rename replaces the inode
+        a file watch would be attached to.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        for changes in watchfiles.watch(self._path.parent, stop_event=stop_event, recursive=False):
+            if any(pathlib.Path(changed).name == self._path.name for _, changed in changes):
+                self.reload()
+                logger.info("Reloaded welcome message from %s", self._path)
+
+    def _read(self) -> str:
+        try:
+            return self._path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return self._default
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import pathlib
+import re
+import tempfile
+from typing import BinaryIO
+
+from src.core.application.exceptions import ObjectNotFoundError
+from src.core.application.ports.outbound.object_storage import ObjectStorage, ObjectWriter, StoredObject
+
+
+KEY_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class LocalObjectWriter(ObjectWriter):
+    """Streams into a temporary file while hashing, then renames it to its content address"""
+
+    def __init__(self, storage: "LocalObjectStorage"):
+        self._storage = storage
+        descriptor, temp_path = tempfile.mkstemp(dir=storage.temp_dir, suffix=".part")
+        self._file = os.fdopen(descriptor, "wb")
+        self._temp_path = pathlib.Path(temp_path)
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._done = False
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self._size += len(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> StoredObject:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._done = True
+
+        key = self._hash.hexdigest()
+        path = self._storage.path(key)
+
+        if path.exists():
+            self._temp_path.unlink()
+            return StoredObject(key, self._size, created=False)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Same filesystem, so the object appears complete or not at all. Racing uploads of the same
+        # content both rename into place, which is harmless: the bytes are identical
+        os.replace(self._temp_path, path)
+        return StoredObject(key, self._size, created=True)
+
+    def abort(self) -> None:
+        if self._done:
+            return
+
+        self._done = True
+        self._file.close()
+        self._temp_path.unlink(missing_ok=True)
+
+
+class LocalObjectStorage(ObjectStorage):
+    """Objects stored under `root` by SHA-256, sharded as `objects/ab/cd/abcd…`.
+
+    Two levels of 256 directories keep each directory small; uploads in progress live in
+    `root/tmp` so they never show up under a key.
+    """
+
+    def __init__(self, root: pathlib.Path):
+        self._objects_dir = root / "objects"
+        self.temp_dir = root / "tmp"
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+
+    def writer(self) -> LocalObjectWriter:
+        return LocalObjectWriter(self)
+
+    def open(self, key: str) -> BinaryIO:
+        try:
+            return self.path(key).open("rb")
+        except FileNotFoundError:
+            raise ObjectNotFoundError(key) from None
+
+    def exists(self, key: str) -> bool:
+        try:
+            return self.path(key).exists()
+        except ObjectNotFoundError:
+            return False
+
+    def path(self, key: str) -> pathlib.Path:
+        # Also keeps a key read from the database from pointing outside the storage root
+        if not KEY_PATTERN.fullmatch(key):
+            raise ObjectNotFoundError(key)
+        return self._objects_dir / key[:2] / key[2:4] / key
\ No newline at end of file
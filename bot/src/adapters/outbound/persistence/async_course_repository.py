@@ -0,0 +1,82 @@
+import uuid
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from collections.abc import AsyncGenerator, Callable
+from src.core.application.ports.outbound.persistence import AsyncCourseRepository
+from src.core.domain.models import Course
+from src.core.domain.common.enums import CourseYear
+from .models import Course as DBCourse, Note as DBNote, Subject as DBSubject
+from .loaders import course_aggregate, catalog_statements
+from .mappers import course_to_domain, catalog_to_domain, course_to_db, course_rows, subject_rows, note_rows
+from .upsert import bulk_upsert_async
+
+
+class AsyncSqlModelCourseRepository(AsyncCourseRepository):
+    def __init__(self, session_factory: Callable[[], AsyncGenerator[AsyncSession, None]]):
+        self._session_factory = session_factory
+
+    async def get_by_id(self, course_id: uuid.UUID) -> Course | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_course = await session.get(DBCourse, course_id, options=[course_aggregate()])
+
+            if not db_course:
+                return None
+
+            return course_to_domain(db_course)
+
+    async def get_by_year(self, year: CourseYear) -> Course | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            statement = select(DBCourse).where(DBCourse.year == year.value).options(course_aggregate())
+            db_course = (await session.exec(statement)).first()
+
+            if not db_course:
+                return None
+
+            return course_to_domain(db_course)
+
+    async def list_all(self) -> list[Course]:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            courses, subjects, notes = catalog_statements()
+
+            return catalog_to_domain(
+                (await session.exec(courses)).all(),
+                (await session.exec(subjects)).all(),
+                (await session.exec(notes)).all(),
+            )
+
+    async def save(self, course: Course) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            # Load the existing aggregate first so merge does not lazy load (not allowed under asyncio).
+            # Keep a reference: the identity map is weak and would drop the preloaded rows before merge
+            _existing = await session.get(DBCourse, course.id, options=[course_aggregate()])
+            await session.merge(course_to_db(course))
+
+    async def save_many(self, courses: list[Course]) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            await bulk_upsert_async(session, DBCourse, course_rows(courses))
+            await bulk_upsert_async(session, DBSubject, [row for course in courses for row in subject_rows(course.id, course.subjects)])
+            await bulk_upsert_async(session, DBNote, [
+                row
+                for course in courses
+                for subject in course.subjects
+                for row in note_rows(subject.id, subject.notes)
+            ])
+
+    async def delete(self, course_id: uuid.UUID) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_course = await session.get(DBCourse, course_id, options=[course_aggregate()])
+
+            if db_course:
+                await session.delete(db_course)
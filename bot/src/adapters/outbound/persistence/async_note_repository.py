@@ -0,0 +1,72 @@
+import uuid
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from collections.abc import AsyncGenerator, Callable
+from src.core.application.ports.outbound.persistence import AsyncNoteRepository
+from src.core.domain.models import Note
+from .models import Note as DBNote
+from .mappers import note_to_domain, note_rows
+from .upsert import bulk_upsert_async
+
+
+class AsyncSqlModelNoteRepository(AsyncNoteRepository):
+    def __init__(self, session_factory: Callable[[], AsyncGenerator[AsyncSession, None]]):
+        self._session_factory = session_factory
+
+    async def get_by_id(self, note_id: uuid.UUID) -> Note | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_note = await session.get(DBNote, note_id)
+
+            if not db_note:
+                return None
+
+            return note_to_domain(db_note)
+
+    async def get_by_title(self, title: str) -> Note | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            statement = select(DBNote).where(DBNote.title == title)
+            db_note = (await session.exec(statement)).first()
+
+            if not db_note:
+                return None
+
+            return note_to_domain(db_note)
+
+    async def save(self, note: Note) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_note = await session.get(DBNote, note.id)
+
+            if db_note:
+                db_note.title = note.title
+                db_note.file_key = note.file_key
+                db_note.telegram_file_id = note.telegram_file_id
+            else:
+                session.add(DBNote(id=note.id, title=note.title, file_key=note.file_key, telegram_file_id=note.telegram_file_id))
+
+    async def save_many(self, subject_id: uuid.UUID, notes: list[Note]) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            await bulk_upsert_async(session, DBNote, note_rows(subject_id, notes))
+
+    async def set_telegram_file_id(self, note_id: uuid.UUID, telegram_file_id: str | None) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            statement = update(DBNote).where(DBNote.id == note_id).values(telegram_file_id=telegram_file_id)
+            await session.exec(statement)
+
+    async def delete(self, note_id: uuid.UUID) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_note = await session.get(DBNote, note_id)
+
+            if db_note:
+                await session.delete(db_note)
@@ -0,0 +1,82 @@
+import uuid
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from collections.abc import AsyncGenerator, Callable
+from src.core.application.ports.outbound.persistence import AsyncReceiptRepository
+from src.core.domain.models import Receipt
+from .models import Receipt as DBReceipt
+from .loaders import receipt_aggregate
+from .mappers import receipt_rows, receipt_to_domain, receipt_to_db
+from .upsert import bulk_upsert_async
+from .receipt_repository import get_many_statement, list_by_buyer_statement
+
+
+class AsyncSqlModelReceiptRepository(AsyncReceiptRepository):
+    def __init__(self, session_factory: Callable[[], AsyncGenerator[AsyncSession, None]]):
+        self._session_factory = session_factory
+
+    async def get_by_id(self, receipt_id: uuid.UUID) -> Receipt | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_receipt = await session.get(DBReceipt, receipt_id, options=[receipt_aggregate()])
+
+            if not db_receipt:
+                return None
+
+            return receipt_to_domain(db_receipt)
+
+    async def get_many(self, receipt_ids: list[uuid.UUID]) -> list[Receipt]:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_receipts = (await session.exec(get_many_statement(receipt_ids))).all()
+
+            return [receipt_to_domain(db_receipt) for db_receipt in db_receipts]
+
+    async def get_by_buyer_id(self, buyer_id: int) -> Receipt | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            statement = (
+                select(DBReceipt)
+                .where(DBReceipt.buyer_id == buyer_id)
+                .order_by(DBReceipt.id.desc())
+                .limit(1)
+                .options(receipt_aggregate())
+            )
+            db_receipt = (await session.exec(statement)).first()
+
+            if not db_receipt:
+                return None
+
+            return receipt_to_domain(db_receipt)
+
+    async def list_by_buyer(self, buyer_id: int, after: uuid.UUID | None = None, limit: int = 20) -> list[Receipt]:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_receipts = (await session.exec(list_by_buyer_statement(buyer_id, after, limit))).all()
+
+            return [receipt_to_domain(db_receipt) for db_receipt in db_receipts]
+
+    async def save(self, receipt: Receipt) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            await session.merge(receipt_to_db(receipt))
+
+    async def save_many(self, receipts: list[Receipt]) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            await bulk_upsert_async(session, DBReceipt, receipt_rows(receipts))
+
+    async def delete(self, receipt_id: uuid.UUID) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_receipt = await session.get(DBReceipt, receipt_id)
+
+            if db_receipt:
+                await session.delete(db_receipt)
@@ -0,0 +1,63 @@
+import uuid
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from collections.abc import AsyncGenerator, Callable
+from src.core.application.ports.outbound.persistence import AsyncSubjectRepository
+from src.core.domain.models import Subject
+from .models import Note as DBNote, Subject as DBSubject
+from .loaders import subject_aggregate
+from .mappers import subject_to_domain, subject_to_db, subject_rows, note_rows
+from .upsert import bulk_upsert_async
+
+
+class AsyncSqlModelSubjectRepository(AsyncSubjectRepository):
+    def __init__(self, session_factory: Callable[[], AsyncGenerator[AsyncSession, None]]):
+        self._session_factory = session_factory
+
+    async def get_by_id(self, subject_id: uuid.UUID) -> Subject | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_subject = await session.get(DBSubject, subject_id, options=[subject_aggregate()])
+
+            if not db_subject:
+                return None
+
+            return subject_to_domain(db_subject)
+
+    async def get_by_name(self, name: str) -> Subject | None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            statement = select(DBSubject).where(DBSubject.name == name).options(subject_aggregate())
+            db_subject = (await session.exec(statement)).first()
+
+            if not db_subject:
+                return None
+
+            return subject_to_domain(db_subject)
+
+    async def save(self, subject: Subject) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            # Load the existing aggregate first so merge does not lazy load (not allowed under asyncio).
+            # Keep a reference: the identity map is weak and would drop the preloaded rows before merge
+            _existing = await session.get(DBSubject, subject.id, options=[subject_aggregate()])
+            await session.merge(subject_to_db(subject))
+
+    async def save_many(self, course_id: uuid.UUID, subjects: list[Subject]) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            await bulk_upsert_async(session, DBSubject, subject_rows(course_id, subjects))
+            await bulk_upsert_async(session, DBNote, [row for subject in subjects for row in note_rows(subject.id, subject.notes)])
+
+    async def delete(self, subject_id: uuid.UUID) -> None:
+        async with self._session_factory() as session:
+            session: AsyncSession
+
+            db_subject = await session.get(DBSubject, subject_id, options=[subject_aggregate()])
+
+            if db_subject:
+                await session.delete(db_subject)
@@ -0,0 +1,168 @@
+import logging
+import threading
+from collections.abc import Callable, Generator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from sqlmodel import Session, delete, select
+from src.core.application.ports.outbound.persistence import ConversationStateStore
+from .models import ConversationState as DBConversationState
+from .upsert import bulk_upsert
+
+
+logger = logging.getLogger(__name__)
+
+
+class SqlModelConversationStateStore(ConversationStateStore):
+    """Conversation states served from memory and written to the database in the background.
+
+    `load` reads all states once, after that `get` never touches the database. `set` and
+    `delete` change the in-memory copy and mark the user dirty. A background thread writes
+    the dirty users every `flush_interval` seconds, sooner once `max_batch` of them are
+    waiting, with one upsert and one delete per batch, so a user who goes through several
+    steps between flushes costs a single write. `close` writes the rest.
+
+    The in-memory copy is authoritative: with several workers, the updates of one user have
+    to reach the same worker (e.g. webhooks routed by chat id), a restart picks up where the
+    last flush left off. States not set for `max_age` are dropped, on `load` and then on
+    every flush, so abandoned conversations do not pile up in memory.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Generator[Session, None, None]],
+        flush_interval: float = 1.0,
+        max_batch: int = 200,
+        max_age: timedelta = timedelta(days=7),
+    ):
+        self._session_factory = session_factory
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._max_age = max_age
+
+        self._condition = threading.Condition()
+        # Serialises flushes from the thread and from `close`, so an older batch never lands last
+        self._flush_lock = threading.Lock()
+        self._states: dict[int, dict[str, Any]] = {}
+        # When each state was last set, oldest first: expired ones are found from the front
+        self._touched: dict[int, datetime] = {}
+        self._dirty: set[int] = set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def load(self) -> None:
+        with self._session_factory() as session:
+            session: Session
+
+            expired = datetime.now(UTC) - self._max_age
+            session.exec(delete(DBConversationState).where(DBConversationState.updated_at < expired))
+            statement = select(
+                DBConversationState.user_id, DBConversationState.state, DBConversationState.updated_at
+            ).order_by(DBConversationState.updated_at)
+            rows = session.exec(statement).all()
+
+        with self._condition:
+            self._states = {user_id: state for user_id, state, _ in rows}
+            self._touched = {user_id: updated_at for user_id, _, updated_at in rows}
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="conversation-state-store", daemon=True)
+        self._thread.start()
+
+    def get(self, user_id: int) -> dict[str, Any] | None:
+        with self._condition:
+            state = self._states.get(user_id)
+            return dict(state) if state is not None else None
+
+    def set(self, user_id: int, state: dict[str, Any]) -> None:
+        with self._condition:
+            self._states[user_id] = dict(state)
+            self._touched.pop(user_id, None)
+            self._touched[user_id] = datetime.now(UTC)
+            self._mark_dirty(user_id)
+
+    def delete(self, user_id: int) -> None:
+        with self._condition:
+            if self._states.pop(user_id, None) is not None:
+                del self._touched[user_id]
+                self._mark_dirty(user_id)
+
+    def flush(self) -> int:
+        """Write the dirty users now; returns how many were written"""
+        with self._flush_lock:
+            with self._condition:
+                self._evict_expired()
+                dirty, self._dirty = self._dirty, set()
+                # The latest state of each user, however many times it changed since the last flush
+                states = {user_id: self._states.get(user_id) for user_id in dirty}
+
+            if not states:
+                return 0
+
+            now = datetime.now(UTC)
+            rows = [
+                {"user_id": user_id, "state": state, "updated_at": now}
+                for user_id, state in states.items()
+                if state is not None
+            ]
+            deleted = [user_id for user_id, state in states.items() if state is None]
+
+            try:
+                with self._session_factory() as session:
+                    session: Session
+
+                    bulk_upsert(session, DBConversationState, rows, index_elements=("user_id",))
+                    if deleted:
+                        session.exec(delete(DBConversationState).where(DBConversationState.user_id.in_(deleted)))
+            except Exception:
+                with self._condition:
+                    # Written again on the next flush, with whatever state is current by then
+                    self._dirty |= dirty
+                raise
+
+            return len(states)
+
+    def close(self) -> None:
+        """Stop the background thread and write the remaining changes"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Lost conversation states of %d users", len(self._dirty))
+
+    def _evict_expired(self) -> None:
+        """Drop states not set for `max_age`; their rows are deleted with the dirty batch"""
+        expired = datetime.now(UTC) - self._max_age
+        while self._touched:
+            user_id, touched_at = next(iter(self._touched.items()))
+            if touched_at >= expired:
+                break
+            del self._touched[user_id]
+            del self._states[user_id]
+            self._dirty.add(user_id)
+
+    def _mark_dirty(self, user_id: int) -> None:
+        self._dirty.add(user_id)
+        if len(self._dirty) >= self._max_batch:
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or len(self._dirty) >= self._max_batch, self._flush_interval)
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to save conversation states, retrying in %ss", self._flush_interval)
+                with self._condition:
+                    # Without the pause a full batch would be retried in a tight loop
+                    self._condition.wait_for(lambda: self._closed, self._flush_interval)
\ No newline at end of file
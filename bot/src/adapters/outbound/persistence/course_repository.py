@@ -1,69 +1,82 @@
 import uuid
 from sqlmodel import Session, select
 from collections.abc import Callable, Generator
-from src.core.application.ports.outbound.persistence import CourseRepository, SubjectRepository
+from src.core.application.ports.outbound.persistence import CourseRepository
 from src.core.domain.models import Course
-from .models import Course as DBCourse
+from .models import Course as DBCourse, Note as DBNote, Subject as DBSubject
+from .loaders import course_aggregate, catalog_statements
+from .mappers import course_to_domain, catalog_to_domain, course_to_db, course_rows, subject_rows, note_rows
+from .upsert import bulk_upsert
 from src.core.domain.common.enums import CourseYear
 
 
 class SqlModelCourseRepository(CourseRepository):
-    def __init__(self, session_factory: Callable[[], Generator[Session, None, None]], subject_repository: SubjectRepository):
+    def __init__(self, session_factory: Callable[[], Generator[Session, None, None]]):
         self._session_factory = session_factory
-        self._subject_repository = subject_repository
 
     def get_by_id(self, course_id: uuid.UUID) -> Course | None:
         with self._session_factory() as session:
             session: Session
 
-            db_course = session.get(DBCourse, course_id)
+            db_course = session.get(DBCourse, course_id, options=[course_aggregate()])
 
             if not db_course:
                 return None
 
-            subjects = [
-                self._subject_repository.get_by_id(subject.id)
-                for subject in db_course.subjects
-            ]
-
-            return Course(id=db_course.id, year=CourseYear(db_course.year), subjects=subjects)
+            return course_to_domain(db_course)
 
     def get_by_year(self, year: CourseYear) -> Course | None:
         with self._session_factory() as session:
             session: Session
 
-            statement = select(DBCourse).where(DBCourse.year == year.value)
+            statement = select(DBCourse).where(DBCourse.year == year.value).options(course_aggregate())
             db_course = session.exec(statement).first()
 
             if not db_course:
                 return None
 
-            subjects = [
-                self._subject_repository.get_by_id(subject.id)
-                for subject in db_course.subjects
-            ]
+            return course_to_domain(db_course)
+
+    def list_all(self) -> list[Course]:
+        with self._session_factory() as session:
+            session: Session
 
-            return Course(id=db_course.id, year=year, subjects=subjects)
+            courses, subjects, notes = catalog_statements()
+
+            return catalog_to_domain(
+                session.exec(courses).all(),
+                session.exec(subjects).all(),
+                session.exec(notes).all(),
+            )
 
     def save(self, course: Course) -> None:
-        # Save of subjects might be broken. Need testing
         with self._session_factory() as session:
             session: Session
 
-            for subject in course.subjects:
-                self._subject_repository.save(subject)
+            # Load the existing aggregate in one go so merge does not fetch subjects and notes one by one
+            # Keep a reference: the identity map is weak and would drop the preloaded rows before merge
+            _existing = session.get(DBCourse, course.id, options=[course_aggregate()])
+            session.merge(course_to_db(course))
 
-            db_course = DBCourse(id=course.id, year=course.year.value, subjects=course.subjects)
+    def save_many(self, courses: list[Course]) -> None:
+        with self._session_factory() as session:
+            session: Session
 
-            session.add(db_course)
-            session.commit()
+            bulk_upsert(session, DBCourse, course_rows(courses))
+            bulk_upsert(session, DBSubject, [row for course in courses for row in subject_rows(course.id, course.subjects)])
+            bulk_upsert(session, DBNote, [
+                row
+                for course in courses
+                for subject in course.subjects
+                for row in note_rows(subject.id, subject.notes)
+            ])
 
     def delete(self, course_id: uuid.UUID) -> None:
         with self._session_factory() as session:
             session: Session
 
-            db_course = session.get(DBCourse, course_id)
+            # Cascade delete needs the children in the session, load them up front instead of lazily
+            db_course = session.get(DBCourse, course_id, options=[course_aggregate()])
 
             if db_course:
-                session.delete(db_course)
-                session.commit()
\ No newline at end of file
+                session.delete(db_course)
\ No newline at end of file
@@ -0,0 +1,73 @@
+import threading
+import uuid
+from collections.abc import Iterable
+from typing import Any, TypeVar
+from weakref import WeakValueDictionary
+
+from src.core.domain.models import Note
+from src.core.domain.models.base_model import BaseModel
+
+
+T = TypeVar("T", bound=BaseModel)
+
+# id, title, file_key, telegram_file_id
+NoteRow = tuple[uuid.UUID, str, str | None, str | None]
+
+
+class IdentityMap:
+    """Hands out one shared domain instance per entity while anybody still references it.
+
+    Every repository read used to build its own copy of the same note or subject, so a
+    cached catalog held as many copies as there had been reads. Domain models are
+    immutable, so a read whose fields match the live instance can return that instance;
+    a read with changed fields builds a new instance and replaces it in the map.
+
+    Only aggregates (subjects, courses) are tracked, with weak references that disappear
+    together with the last user. Notes are found through their live subject: a weak entry
+    per note would cost about twice as much as the note it saves.
+    """
+
+    def __init__(self):
+        self._entities: WeakValueDictionary[uuid.UUID, BaseModel] = WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, cls: type[T], id: uuid.UUID, **fields: Any) -> T:
+        with self._lock:
+            entity = self._entities.get(id)
+
+            # Children come from the map as well, so comparing tuples of them is mostly identity checks
+            if type(entity) is not cls or any(getattr(entity, name) != value for name, value in fields.items()):
+                entity = cls(id=id, **fields)
+                self._entities[id] = entity
+
+            return entity
+
+    def notes(self, subject_id: uuid.UUID, rows: Iterable[NoteRow]) -> tuple[Note, ...]:
+        """Notes of a subject from (id, title, file_key, telegram_file_id) rows, reusing the live subject's notes"""
+        subject = self._entities.get(subject_id)
+        live_notes = {note.id: note for note in subject.notes} if subject is not None else {}
+
+        return tuple(self._note(live_notes.get(row[0]), row) for row in rows)
+
+    def note(self, subject_id: uuid.UUID, row: NoteRow) -> Note:
+        subject = self._entities.get(subject_id)
+        live_note = next((note for note in subject.notes if note.id == row[0]), None) if subject is not None else None
+
+        return self._note(live_note, row)
+
+    @staticmethod
+    def _note(live_note: Note | None, row: NoteRow) -> Note:
+        id, title, file_key, telegram_file_id = row
+
+        if (
+            live_note is not None
+            and live_note.title == title
+            and live_note.file_key == file_key
+            and live_note.telegram_file_id == telegram_file_id
+        ):
+            return live_note
+
+        return Note(id=id, title=title, file_key=file_key, telegram_file_id=telegram_file_id)
+
+    def __len__(self) -> int:
+        return len(self._entities)
@@ -0,0 +1,35 @@
+"""Loader options that hydrate whole aggregates with a fixed number of queries.
+
+`selectinload` issues one extra `SELECT ... WHERE parent_id IN (...)` per relationship
+level, so a course costs 3 queries (courses, subjects, notes) regardless of how many
+subjects and notes it has.
+"""
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+
+from .models import Course as DBCourse, Note as DBNote, Receipt as DBReceipt, Subject as DBSubject
+
+
+def subject_aggregate():
+    return selectinload(DBSubject.notes)
+
+
+def course_aggregate():
+    return selectinload(DBCourse.subjects).selectinload(DBSubject.notes)
+
+
+def receipt_aggregate():
+    return selectinload(DBReceipt.note)
+
+
+def catalog_statements():
+    """Column-only selects for the whole catalog, see `mappers.catalog_to_domain`.
+
+    Skipping ORM entities (identity map, instrumentation) makes loading a catalog with
+    100k notes several times faster than going through `course_aggregate`.
+    """
+    return (
+        select(DBCourse.id, DBCourse.year).order_by(DBCourse.year),
+        select(DBSubject.id, DBSubject.name, DBSubject.course_id).order_by(DBSubject.id),
+        select(DBNote.id, DBNote.title, DBNote.file_key, DBNote.telegram_file_id, DBNote.subject_id).order_by(DBNote.id),
+    )
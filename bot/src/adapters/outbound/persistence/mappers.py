@@ -0,0 +1,174 @@
+import uuid
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from src.core.domain.models import Course, Note, Receipt, Subject, Submission
+from src.core.domain.common.enums import CourseYear, SubmissionStatus
+from .identity_map import IdentityMap, NoteRow
+from .models import (
+    Course as DBCourse,
+    Note as DBNote,
+    Receipt as DBReceipt,
+    Subject as DBSubject,
+    Submission as DBSubmission,
+)
+
+
+# Catalog entities are shared between reads, see `IdentityMap`
+catalog_identity_map = IdentityMap()
+
+
+def note_to_domain(db_note: DBNote) -> Note:
+    return catalog_identity_map.note(db_note.subject_id, note_row(db_note))
+
+
+def note_row(db_note: DBNote) -> NoteRow:
+    return db_note.id, db_note.title, db_note.file_key, db_note.telegram_file_id
+
+
+def subject_to_domain(db_subject: DBSubject) -> Subject:
+    """Expects `db_subject.notes` to be already loaded (see `loaders.subject_aggregate`)."""
+    return catalog_identity_map.get(
+        Subject,
+        db_subject.id,
+        name=db_subject.name,
+        notes=catalog_identity_map.notes(db_subject.id, (note_row(db_note) for db_note in db_subject.notes)),
+    )
+
+
+def course_to_domain(db_course: DBCourse) -> Course:
+    """Expects subjects and their notes to be already loaded (see `loaders.course_aggregate`)."""
+    return catalog_identity_map.get(
+        Course,
+        db_course.id,
+        year=CourseYear(db_course.year),
+        subjects=tuple(subject_to_domain(db_subject) for db_subject in db_course.subjects),
+    )
+
+
+def catalog_to_domain(
+    course_rows: Iterable[tuple[uuid.UUID, int]],
+    subject_rows: Iterable[tuple[uuid.UUID, str, uuid.UUID]],
+    note_rows: Iterable[tuple[uuid.UUID, str, str | None, str | None, uuid.UUID]],
+) -> list[Course]:
+    """Assemble courses from the rows selected by `loaders.catalog_statements`"""
+    notes_by_subject: dict[uuid.UUID, list[NoteRow]] = {}
+    for note_id, title, file_key, telegram_file_id, subject_id in note_rows:
+        notes_by_subject.setdefault(subject_id, []).append((note_id, title, file_key, telegram_file_id))
+
+    subjects_by_course: dict[uuid.UUID, list[Subject]] = {}
+    for subject_id, name, course_id in subject_rows:
+        notes = catalog_identity_map.notes(subject_id, notes_by_subject.get(subject_id, ()))
+        subjects_by_course.setdefault(course_id, []).append(
+            catalog_identity_map.get(Subject, subject_id, name=name, notes=notes)
+        )
+
+    return [
+        catalog_identity_map.get(
+            Course, course_id, year=CourseYear(year), subjects=tuple(subjects_by_course.get(course_id, ()))
+        )
+        for course_id, year in course_rows
+    ]
+
+
+def receipt_to_domain(db_receipt: DBReceipt) -> Receipt:
+    """Expects `db_receipt.note` to be already loaded (see `loaders.receipt_aggregate`)."""
+    return Receipt(
+        id=db_receipt.id,
+        buyer_id=db_receipt.buyer_id,
+        buyer_name=db_receipt.buyer_name,
+        payment_credentials=db_receipt.payment_credentials,
+        price_rub=db_receipt.price_rub,
+        note=note_to_domain(db_receipt.note),
+    )
+
+
+def submission_to_domain(db_submission: DBSubmission) -> Submission:
+    return Submission(
+        id=db_submission.id,
+        uploader_id=db_submission.uploader_id,
+        uploader_name=db_submission.uploader_name,
+        subject_id=db_submission.subject_id,
+        title=db_submission.title,
+        payment_details=db_submission.payment_details,
+        file_key=db_submission.file_key,
+        status=SubmissionStatus(db_submission.status),
+    )
+
+
+def subject_to_db(subject: Subject) -> DBSubject:
+    return DBSubject(
+        id=subject.id,
+        name=subject.name,
+        notes=[
+            DBNote(id=note.id, title=note.title, file_key=note.file_key, telegram_file_id=note.telegram_file_id)
+            for note in subject.notes
+        ],
+    )
+
+
+def course_to_db(course: Course) -> DBCourse:
+    return DBCourse(
+        id=course.id,
+        year=course.year.value,
+        subjects=[subject_to_db(subject) for subject in course.subjects],
+    )
+
+
+def receipt_to_db(receipt: Receipt) -> DBReceipt:
+    return DBReceipt(
+        id=receipt.id,
+        buyer_id=receipt.buyer_id,
+        buyer_name=receipt.buyer_name,
+        payment_credentials=receipt.payment_credentials,
+        price_rub=receipt.price_rub,
+        note_id=receipt.note.id,
+    )
+
+
+def submission_to_db(submission: Submission) -> DBSubmission:
+    return DBSubmission(
+        id=submission.id,
+        uploader_id=submission.uploader_id,
+        uploader_name=submission.uploader_name,
+        subject_id=submission.subject_id,
+        title=submission.title,
+        payment_details=submission.payment_details,
+        file_key=submission.file_key,
+        status=submission.status.value,
+    )
+
+
+def note_rows(subject_id: uuid.UUID, notes: Sequence[Note]) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": note.id,
+            "title": note.title,
+            "file_key": note.file_key,
+            "telegram_file_id": note.telegram_file_id,
+            "subject_id": subject_id,
+        }
+        for note in notes
+    ]
+
+
+def receipt_rows(receipts: Sequence[Receipt]) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": receipt.id,
+            "buyer_id": receipt.buyer_id,
+            "buyer_name": receipt.buyer_name,
+            "payment_credentials": receipt.payment_credentials,
+            "price_rub": receipt.price_rub,
+            "note_id": receipt.note.id,
+        }
+        for receipt in receipts
+    ]
+
+
+def subject_rows(course_id: uuid.UUID, subjects: Sequence[Subject]) -> list[dict[str, Any]]:
+    return [{"id": subject.id, "name": subject.name, "course_id": course_id} for subject in subjects]
+
+
+def course_rows(courses: Sequence[Course]) -> list[dict[str, Any]]:
+    return [{"id": course.id, "year": course.year.value} for course in courses]
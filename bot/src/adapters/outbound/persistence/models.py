@@ -1,11 +1,14 @@
 import uuid
+from datetime import datetime
+from typing import Any
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Course(SQLModel, table=True):
     id: uuid.UUID = Field(primary_key=True, index=True)
     year: int
-    subjects: list["Subject"] = Relationship(back_populates="course")
+    subjects: list["Subject"] = Relationship(back_populates="course", cascade_delete=True)
 
 
 class Subject(SQLModel, table=True):
@@ -14,24 +17,61 @@ class Subject(SQLModel, table=True):
 
     course_id: uuid.UUID = Field(foreign_key="course.id", index=True)
 
-    course: Course | None = Relationship(back_populates="subjects", cascade_delete=True)
+    course: Course | None = Relationship(back_populates="subjects")
 
-    notes: list["Note"] = Relationship(back_populates="subject")
+    notes: list["Note"] = Relationship(back_populates="subject", cascade_delete=True)
 
 
 class Note(SQLModel, table=True):
     id: uuid.UUID = Field(primary_key=True, index=True)
     title: str
+    file_key: str | None = None
+    telegram_file_id: str | None = None
 
     subject_id: uuid.UUID = Field(foreign_key="subject.id", index=True)
 
-    subject: Subject | None = Relationship(back_populates="notes", cascade_delete=True)
+    subject: Subject | None = Relationship(back_populates="notes")
 
 
 class Receipt(SQLModel, table=True):
+    # Serves keyset pagination of a buyer's history: WHERE buyer_id = ? AND id < ? ORDER BY id DESC
+    __table_args__ = (Index("ix_receipt_buyer_id_id", "buyer_id", "id"),)
+
     id: uuid.UUID = Field(primary_key=True, index=True)
     buyer_id: int
     buyer_name: str
     payment_credentials: str
     price_rub: int
-    note: Note = Relationship(back_populates="checks")
\ No newline at end of file
+
+    note_id: uuid.UUID = Field(foreign_key="note.id", index=True)
+
+    note: Note | None = Relationship()
+
+
+class Submission(SQLModel, table=True):
+    # Partial index over the moderation queue only: its size follows the backlog, not the history
+    __table_args__ = (
+        Index(
+            "ix_submission_pending_id",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: uuid.UUID = Field(primary_key=True, index=True)
+    uploader_id: int
+    uploader_name: str
+    title: str
+    payment_details: str
+    file_key: str
+    status: str
+
+    subject_id: uuid.UUID = Field(foreign_key="subject.id", index=True)
+
+
+class ConversationState(SQLModel, table=True):
+    # Telegram user ids do not fit into 32 bits
+    user_id: int = Field(sa_column=Column(BigInteger, primary_key=True, autoincrement=False))
+    state: dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False, index=True))
@@ -1,9 +1,11 @@
 import uuid
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
 from collections.abc import Callable, Generator
 from src.core.application.ports.outbound.persistence import NoteRepository
 from src.core.domain.models import Note
 from .models import Note as DBNote
+from .mappers import note_to_domain, note_rows
+from .upsert import bulk_upsert
 
 
 class SqlModelNoteRepository(NoteRepository):
@@ -19,7 +21,7 @@ class SqlModelNoteRepository(NoteRepository):
             if not db_note:
                 return None
 
-            return Note(id=db_note.id, title=db_note.title)
+            return note_to_domain(db_note)
 
     def get_by_title(self, title: str) -> Note | None:
         with self._session_factory() as session:
@@ -31,16 +33,33 @@ class SqlModelNoteRepository(NoteRepository):
             if not db_note:
                 return None
 
-            return Note(id=db_note.id, title=db_note.title)
+            return note_to_domain(db_note)
 
     def save(self, note: Note) -> None:
         with self._session_factory() as session:
             session: Session
 
-            db_note = DBNote(id=note.id, title=note.title)
+            db_note = session.get(DBNote, note.id)
 
-            session.add(db_note)
-            session.commit()
+            if db_note:
+                db_note.title = note.title
+                db_note.file_key = note.file_key
+                db_note.telegram_file_id = note.telegram_file_id
+            else:
+                session.add(DBNote(id=note.id, title=note.title, file_key=note.file_key, telegram_file_id=note.telegram_file_id))
+
+    def save_many(self, subject_id: uuid.UUID, notes: list[Note]) -> None:
+        with self._session_factory() as session:
+            session: Session
+
+            bulk_upsert(session, DBNote, note_rows(subject_id, notes))
+
+    def set_telegram_file_id(self, note_id: uuid.UUID, telegram_file_id: str | None) -> None:
+        with self._session_factory() as session:
+            session: Session
+
+            statement = update(DBNote).where(DBNote.id == note_id).values(telegram_file_id=telegram_file_id)
+            session.exec(statement)
 
     def delete(self, note_id: uuid.UUID) -> None:
         with self._session_factory() as session:
@@ -50,5 +69,3 @@ class SqlModelNoteRepository(NoteRepository):
 
             if db_note:
                 session.delete(db_note)
-
-            session.commit()
\ No newline at end of file
@@ -0,0 +1,142 @@
+import logging
+import threading
+import time
+from sqlalchemy.exc import DataError, IntegrityError
+from src.core.application.exceptions import ReceiptJournalFullError
+from src.core.application.ports.outbound.persistence import ReceiptJournal, ReceiptRepository
+from src.core.domain.models import Receipt
+
+
+# The database refused the row itself, e.g. its note was deleted; saving it again cannot succeed
+REJECTED_ERRORS = (IntegrityError, DataError)
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindReceiptJournal(ReceiptJournal):
+    """Buffers receipts in memory and saves them with `ReceiptRepository.save_many`.
+
+    A background thread writes a batch once `max_batch` receipts are waiting or
+    `flush_interval` seconds after the oldest of them arrived, so appending never waits
+    for the database. When a batch fails, its receipts are saved one by one: those the
+    database rejects are logged and dropped, the rest stay buffered and are retried after
+    another interval. At most `max_buffer` receipts are held, beyond that `append` raises
+    ReceiptJournalFullError. `close` writes whatever is left; receipts still buffered
+    when the process is killed are lost.
+    """
+
+    def __init__(
+        self,
+        receipt_repository: ReceiptRepository,
+        flush_interval: float = 0.5,
+        max_batch: int = 100,
+        max_buffer: int = 10_000,
+    ):
+        self._receipt_repository = receipt_repository
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._max_buffer = max_buffer
+
+        self._condition = threading.Condition()
+        # Serialises flushes from the thread and from `close`, so batches are saved in order
+        self._flush_lock = threading.Lock()
+        self._buffer: list[Receipt] = []
+        self._due: float | None = None
+        # A full buffer is not written before this, so a failing database is not hammered
+        self._retry_at = 0.0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="receipt-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, receipt: Receipt) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Receipt journal is closed")
+            if len(self._buffer) >= self._max_buffer:
+                raise ReceiptJournalFullError(f"{len(self._buffer)} receipts are waiting to be saved")
+
+            self._buffer.append(receipt)
+            # Wake the thread to start the interval, or to write a full batch early
+            if self._due is None:
+                self._due = time.monotonic() + self._flush_interval
+                self._condition.notify()
+            elif len(self._buffer) >= self._max_batch:
+                self._condition.notify()
+
+    def flush(self) -> int:
+        """Save everything buffered now; returns the number of receipts saved"""
+        with self._flush_lock:
+            with self._condition:
+                batch, self._buffer, self._due = self._buffer, [], None
+
+            if not batch:
+                return 0
+
+            try:
+                self._receipt_repository.save_many(batch)
+                return len(batch)
+            except Exception:
+                logger.warning("Failed to save a batch of %d receipts, saving them one by one", len(batch), exc_info=True)
+
+            return self._save_one_by_one(batch)
+
+    def _save_one_by_one(self, batch: list[Receipt]) -> int:
+        """Isolate the receipts that fail a batch, so one bad row does not hold back the others"""
+        saved = 0
+        for position, receipt in enumerate(batch):
+            try:
+                self._receipt_repository.save_many([receipt])
+                saved += 1
+            except REJECTED_ERRORS:
+                logger.exception("Dropped a receipt the database rejects: %r", receipt)
+            except Exception:
+                # Not about this receipt, the database is unavailable: keep the rest for the next attempt
+                with self._condition:
+                    self._buffer[:0] = batch[position:]
+                    self._due = self._retry_at = time.monotonic() + self._flush_interval
+                raise
+
+        return saved
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._buffer)
+
+    def close(self) -> None:
+        """Stop the background thread and save the remaining receipts"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Lost %d receipts: %s", len(self._buffer), [str(receipt.id) for receipt in self._buffer])
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._due is None:
+                        self._condition.wait()
+                        continue
+
+                    now = time.monotonic()
+                    if now >= self._due or (len(self._buffer) >= self._max_batch and now >= self._retry_at):
+                        break
+                    self._condition.wait(self._due - now)
+
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to save a batch of receipts, retrying in %ss", self._flush_interval)
\ No newline at end of file
@@ -1,76 +1,99 @@
 import uuid
 from sqlmodel import Session, select
 from collections.abc import Callable, Generator
-from src.core.application.ports.outbound.persistence import ReceiptRepository, NoteRepository
+from src.core.application.ports.outbound.persistence import ReceiptRepository
 from src.core.domain.models import Receipt
 from .models import Receipt as DBReceipt
+from .loaders import receipt_aggregate
+from .mappers import receipt_rows, receipt_to_domain, receipt_to_db
+from .upsert import bulk_upsert
 
 
 class SqlModelReceiptRepository(ReceiptRepository):
-    def __init__(self, session_factory: Callable[[], Generator[Session, None, None]], note_repository: NoteRepository):
+    def __init__(self, session_factory: Callable[[], Generator[Session, None, None]]):
         self._session_factory = session_factory
-        self._note_repository = note_repository
 
     def get_by_id(self, receipt_id: uuid.UUID) -> Receipt | None:
         with self._session_factory() as session:
             session: Session
 
-            db_receipt = session.get(DBReceipt, receipt_id)
+            db_receipt = session.get(DBReceipt, receipt_id, options=[receipt_aggregate()])
+
             if not db_receipt:
                 return None
 
-            note = self._note_repository.get_by_id(db_receipt.note.id)
+            return receipt_to_domain(db_receipt)
 
-            return Receipt(
-                id=db_receipt.id,
-                buyer_id=db_receipt.buyer_id,
-                buyer_name=db_receipt.buyer_name,
-                payment_credentials=db_receipt.payment_credentials,
-                price_rub=db_receipt.price_rub,
-                note=note
-                )
+    def get_many(self, receipt_ids: list[uuid.UUID]) -> list[Receipt]:
+        with self._session_factory() as session:
+            session: Session
+
+            db_receipts = session.exec(get_many_statement(receipt_ids)).all()
+
+            return [receipt_to_domain(db_receipt) for db_receipt in db_receipts]
 
     def get_by_buyer_id(self, buyer_id: int) -> Receipt | None:
         with self._session_factory() as session:
             session: Session
 
-            statement = select(DBReceipt).where(DBReceipt.buyer_id == buyer_id)
+            statement = (
+                select(DBReceipt)
+                .where(DBReceipt.buyer_id == buyer_id)
+                .order_by(DBReceipt.id.desc())
+                .limit(1)
+                .options(receipt_aggregate())
+            )
             db_receipt = session.exec(statement).first()
+
             if not db_receipt:
                 return None
 
-            note = self._note_repository.get_by_id(db_receipt.note.id)
+            return receipt_to_domain(db_receipt)
 
-            return Receipt(
-                id=db_receipt.id,
-                buyer_id=db_receipt.buyer_id,
-                buyer_name=db_receipt.buyer_name,
-                payment_credentials=db_receipt.payment_credentials,
-                price_rub=db_receipt.price_rub,
-                note=note
-            )
+    def list_by_buyer(self, buyer_id: int, after: uuid.UUID | None = None, limit: int = 20) -> list[Receipt]:
+        with self._session_factory() as session:
+            session: Session
+
+            db_receipts = session.exec(list_by_buyer_statement(buyer_id, after, limit)).all()
+
+            return [receipt_to_domain(db_receipt) for db_receipt in db_receipts]
 
     def save(self, receipt: Receipt) -> None:
-        # Save of receipts might be broken. Need testing
         with self._session_factory() as session:
             session: Session
 
-            db_receipt = DBReceipt(
-                id=receipt.id,
-                buyer_id=receipt.buyer_id,
-                buyer_name=receipt.buyer_name,
-                payment_credentials=receipt.payment_credentials,
-                price_rub=receipt.price_rub,
-                note=receipt.note
-            )
-            session.add(db_receipt)
-            session.commit()
+            session.merge(receipt_to_db(receipt))
+
+    def save_many(self, receipts: list[Receipt]) -> None:
+        with self._session_factory() as session:
+            session: Session
+
+            bulk_upsert(session, DBReceipt, receipt_rows(receipts))
 
     def delete(self, receipt_id: uuid.UUID) -> None:
         with self._session_factory() as session:
             session: Session
 
             db_receipt = session.get(DBReceipt, receipt_id)
+
             if db_receipt:
                 session.delete(db_receipt)
-                session.commit()
\ No newline at end of file
+
+
+def get_many_statement(receipt_ids: list[uuid.UUID]):
+    # Notes come in one more query for all receipts, shared notes loaded once
+    return select(DBReceipt).where(DBReceipt.id.in_(receipt_ids)).options(receipt_aggregate())
+
+
+def list_by_buyer_statement(buyer_id: int, after: uuid.UUID | None, limit: int):
+    """Newest first keyset page served by the (buyer_id, id) index.
+
+    Receipt ids are UUIDv7, so ordering by id is ordering by creation time and
+    `id < after` seeks straight to the next page without an OFFSET scan.
+    """
+    statement = select(DBReceipt).where(DBReceipt.buyer_id == buyer_id)
+
+    if after is not None:
+        statement = statement.where(DBReceipt.id < after)
+
+    return statement.order_by(DBReceipt.id.desc()).limit(limit).options(receipt_aggregate())
@@ -1,68 +1,62 @@
 import uuid
 from sqlmodel import Session, select
 from collections.abc import Callable, Generator
-from src.core.application.ports.outbound.persistence import SubjectRepository, NoteRepository
+from src.core.application.ports.outbound.persistence import SubjectRepository
 from src.core.domain.models import Subject
-from .models import Subject as DBSubject
+from .models import Note as DBNote, Subject as DBSubject
+from .loaders import subject_aggregate
+from .mappers import subject_to_domain, subject_to_db, subject_rows, note_rows
+from .upsert import bulk_upsert
 
 
 class SqlModelSubjectRepository(SubjectRepository):
-    def __init__(self, session_factory: Callable[[], Generator[Session, None, None]], note_repository: NoteRepository):
+    def __init__(self, session_factory: Callable[[], Generator[Session, None, None]]):
         self._session_factory = session_factory
-        self._note_repository = note_repository
 
     def get_by_id(self, subject_id: uuid.UUID) -> Subject | None:
         with self._session_factory() as session:
             session: Session
 
-            db_subject = session.get(DBSubject, subject_id)
+            db_subject = session.get(DBSubject, subject_id, options=[subject_aggregate()])
 
             if not db_subject:
                 return None
 
-            notes = [
-                self._note_repository.get_by_id(note.id)
-                    for note in db_subject.notes
-            ]
+            return subject_to_domain(db_subject)
 
-        return Subject(id=db_subject.id, name=db_subject.name, notes=notes)
-
-    def get_by_name(self, name):
+    def get_by_name(self, name: str) -> Subject | None:
         with self._session_factory() as session:
             session: Session
 
-            statement = select(DBSubject).where(DBSubject.name == name)
+            statement = select(DBSubject).where(DBSubject.name == name).options(subject_aggregate())
             db_subject = session.exec(statement).first()
 
             if not db_subject:
                 return None
 
-            notes = [
-                self._note_repository.get_by_id(note.id)
-                for note in db_subject.notes
-            ]
-
-        return Subject(id=db_subject.id, name=db_subject.name, notes=notes)
+            return subject_to_domain(db_subject)
 
     def save(self, subject: Subject) -> None:
-        # Save of notes might be broken. Need testing
         with self._session_factory() as session:
             session: Session
 
-            for note in subject.notes:
-                self._note_repository.save(note)
+            # Load the existing aggregate in one go so merge does not fetch notes one by one
+            # Keep a reference: the identity map is weak and would drop the preloaded rows before merge
+            _existing = session.get(DBSubject, subject.id, options=[subject_aggregate()])
+            session.merge(subject_to_db(subject))
 
-            db_subject = DBSubject(id=subject.id, name=subject.name, notes=subject.notes)
+    def save_many(self, course_id: uuid.UUID, subjects: list[Subject]) -> None:
+        with self._session_factory() as session:
+            session: Session
 
-            session.add(db_subject)
-            session.commit()
+            bulk_upsert(session, DBSubject, subject_rows(course_id, subjects))
+            bulk_upsert(session, DBNote, [row for subject in subjects for row in note_rows(subject.id, subject.notes)])
 
     def delete(self, subject_id: uuid.UUID) -> None:
         with self._session_factory() as session:
             session: Session
 
-            db_subject = session.get(DBSubject, subject_id)
+            # Cascade delete needs the children in the session, load them up front instead of lazily
+            db_subject = session.get(DBSubject, subject_id, options=[subject_aggregate()])
             if db_subject:
-                session.delete(db_subject)
-
-            session.commit()
\ No newline at end of file
+                session.delete(db_subject)
\ No newline at end of file
@@ -0,0 +1,53 @@
+import uuid
+from sqlmodel import Session, select
+from collections.abc import Callable, Generator
+from src.core.application.ports.outbound.persistence import SubmissionRepository
+from src.core.domain.models import Submission
+from src.core.domain.common.enums import SubmissionStatus
+from .models import Submission as DBSubmission
+from .mappers import submission_to_domain, submission_to_db
+
+
+class SqlModelSubmissionRepository(SubmissionRepository):
+    def __init__(self, session_factory: Callable[[], Generator[Session, None, None]]):
+        self._session_factory = session_factory
+
+    def get_by_id(self, submission_id: uuid.UUID) -> Submission | None:
+        with self._session_factory() as session:
+            session: Session
+
+            db_submission = session.get(DBSubmission, submission_id)
+
+            if not db_submission:
+                return None
+
+            return submission_to_domain(db_submission)
+
+    def list_pending(self, after: uuid.UUID | None = None, limit: int = 20) -> list[Submission]:
+        with self._session_factory() as session:
+            session: Session
+
+            # Matches the partial index predicate, so only the pending queue is scanned
+            statement = select(DBSubmission).where(DBSubmission.status == SubmissionStatus.PENDING.value)
+
+            if after is not None:
+                statement = statement.where(DBSubmission.id > after)
+
+            statement = statement.order_by(DBSubmission.id).limit(limit)
+
+            return [submission_to_domain(db_submission) for db_submission in session.exec(statement).all()]
+
+    def save(self, submission: Submission) -> None:
+        with self._session_factory() as session:
+            session: Session
+
+            session.merge(submission_to_db(submission))
+
+    def delete(self, submission_id: uuid.UUID) -> None:
+        with self._session_factory() as session:
+            session: Session
+
+            db_submission = session.get(DBSubmission, submission_id)
+
+            if db_submission:
+                session.delete(db_submission)
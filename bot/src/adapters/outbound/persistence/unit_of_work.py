@@ -0,0 +1,44 @@
+from contextlib import nullcontext
+from typing import Self
+from sqlmodel import Session
+from collections.abc import Callable
+from src.core.application.ports.outbound.persistence import UnitOfWork
+from .course_repository import SqlModelCourseRepository
+from .subject_repository import SqlModelSubjectRepository
+from .note_repository import SqlModelNoteRepository
+from .receipt_repository import SqlModelReceiptRepository
+from .submission_repository import SqlModelSubmissionRepository
+
+
+class SqlModelUnitOfWork(UnitOfWork):
+    def __init__(self, session_maker: Callable[[], Session]):
+        self._session_maker = session_maker
+        self._session: Session | None = None
+
+    def __enter__(self) -> Self:
+        self._session = self._session_maker()
+
+        # Repositories get the shared session; its lifetime and transaction belong to the unit of work
+        def session_factory():
+            return nullcontext(self._session)
+
+        self.notes = SqlModelNoteRepository(session_factory)
+        self.subjects = SqlModelSubjectRepository(session_factory)
+        self.courses = SqlModelCourseRepository(session_factory)
+        self.receipts = SqlModelReceiptRepository(session_factory)
+        self.submissions = SqlModelSubmissionRepository(session_factory)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.rollback()
+        finally:
+            self._session.close()
+            self._session = None
+
+    def commit(self) -> None:
+        self._session.commit()
+
+    def rollback(self) -> None:
+        self._session.rollback()
@@ -0,0 +1,65 @@
+"""Bulk `INSERT ... ON CONFLICT DO UPDATE` for saving many rows at once.
+
+The statement is compiled once and executed with the whole batch of parameters, which
+the drivers send as a batch (sqlite3 `executemany`, psycopg pipeline, asyncpg prepared
+`executemany`). Compiling a literal multi-row VALUES clause instead costs SQLAlchemy
+tens of microseconds per bound value, which dominates for large catalogs.
+"""
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert_statement(
+    dialect_name: str,
+    model: type[SQLModel],
+    columns: Sequence[str],
+    index_elements: Sequence[str] = ("id",),
+) -> Insert:
+    insert = _INSERTS.get(dialect_name)
+    if insert is None:
+        raise NotImplementedError(f"Bulk upsert is not supported for dialect {dialect_name!r}")
+
+    statement = insert(model.__table__)
+    return statement.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={column: statement.excluded[column] for column in columns if column not in index_elements},
+    )
+
+
+def unique_rows(rows: Sequence[dict[str, Any]], index_elements: Sequence[str] = ("id",)) -> list[dict[str, Any]]:
+    """Keep the last version of every key: one statement may not update the same row twice"""
+    return list({tuple(row[key] for key in index_elements): row for row in rows}.values())
+
+
+def bulk_upsert(
+    session: Session,
+    model: type[SQLModel],
+    rows: Sequence[dict[str, Any]],
+    index_elements: Sequence[str] = ("id",),
+) -> None:
+    if not rows:
+        return
+
+    rows = unique_rows(rows, index_elements)
+    statement = upsert_statement(session.get_bind().dialect.name, model, list(rows[0]), index_elements)
+    session.exec(statement, params=rows)
+
+
+async def bulk_upsert_async(session: AsyncSession, model: type[SQLModel], rows: Sequence[dict[str, Any]]) -> None:
+    if not rows:
+        return
+
+    rows = unique_rows(rows)
+    statement = upsert_statement(session.bind.dialect.name, model, list(rows[0]))
+    await session.exec(statement, params=rows)
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.core.application.ports.outbound.activity_listener import ActivityListener
+from src.core.application.ports.outbound.messenger import MessagePriority
+from src.core.application.ports.outbound.persistence import CourseRepository
+from src.core.domain.models import Receipt, Submission
+from .send_scheduler import TelegramSendScheduler
+
+
+# How often a digest held back by a busy send queue checks whether the queue has drained
+IDLE_POLL_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Digest:
+    first_event_at: float
+    purchases: Counter[uuid.UUID] = field(default_factory=Counter)
+    revenue_rub: int = 0
+    receipts: list[Receipt] = field(default_factory=list)
+    submissions: Counter[uuid.UUID] = field(default_factory=Counter)
+
+
+class AdminDigestNotifier(ActivityListener):
+    """Tells the admin about purchases and uploads in digests instead of a message per event.
+
+    A digest goes out once `window_seconds` have passed since the previous one and the
+    send queue is idle, so on a quiet bot an event is reported right away. While users are
+    being answered, events pile up instead, but for no longer than a window after the
+    first of them. Either way the admin gets at most one message per window, sent with
+    ADMIN priority, and it does not compete with the admin's own commands for the chat's
+    rate limit.
+    """
+
+    def __init__(
+        self,
+        send_scheduler: TelegramSendScheduler,
+        admin_id: int,
+        course_repository: CourseRepository,
+        window_seconds: float,
+        max_lines: int = 15,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._send_scheduler = send_scheduler
+        self._admin_id = admin_id
+        self._course_repository = course_repository
+        self._window = window_seconds
+        self._max_lines = max_lines
+        self._clock = clock
+
+        # Events come from worker threads, the digest is sent from the event loop
+        self._lock = threading.Lock()
+        self._digest: _Digest | None = None
+        self._last_sent_at = float("-inf")
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def purchase_created(self, receipt: Receipt) -> None:
+        with self._lock:
+            digest = self._pending()
+            digest.purchases[receipt.note.id] += 1
+            digest.revenue_rub += receipt.price_rub
+            digest.receipts.append(receipt)
+        self._wake()
+
+    def submission_created(self, submission: Submission) -> None:
+        with self._lock:
+            self._pending().submissions[submission.subject_id] += 1
+        self._wake()
+
+    def start(self) -> None:
+        """Start sending digests; call from the event loop the send scheduler runs on"""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run())
+        if self._digest is not None:
+            self._wakeup.set()
+
+    async def close(self) -> None:
+        """Stop, sending what has been collected so far"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._loop = None
+
+        if self._digest is not None:
+            await self._send()
+
+    def _pending(self) -> _Digest:
+        if self._digest is None:
+            self._digest = _Digest(first_event_at=self._clock())
+        return self._digest
+
+    def _wake(self) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._digest is not None:
+                now = self._clock()
+                send_at = self._last_sent_at + self._window
+                if not self._send_scheduler.is_idle():
+                    send_at = max(send_at, self._digest.first_event_at + self._window)
+
+                if now < send_at:
+                    await asyncio.sleep(min(send_at - now, IDLE_POLL_SECONDS))
+                    continue
+
+                await self._send()
+
+    async def _send(self) -> None:
+        with self._lock:
+            digest, self._digest = self._digest, None
+        self._last_sent_at = self._clock()
+
+        try:
+            # Served from the catalog cache as a rule, still a potential database read
+            labels = await asyncio.to_thread(self._catalog_labels)
+            await self._send_scheduler.send_message(self._admin_id, self._render(digest, labels), MessagePriority.ADMIN)
+        except Exception:
+            logger.exception("Failed to send the admin digest")
+
+    def _catalog_labels(self) -> dict[uuid.UUID, str]:
+        """"<year> курс — <subject>" by subject id and by note id"""
+        labels = {}
+        for course in self._course_repository.list_all():
+            for subject in course.subjects:
+                label = labels[subject.id] = f"{course.year.value} курс — {subject.name}"
+                for note in subject.notes:
+                    labels[note.id] = label
+        return labels
+
+    def _render(self, digest: _Digest, labels: dict[uuid.UUID, str]) -> str:
+        lines = []
+
+        if digest.purchases:
+            lines.append(f"Покупки: {digest.purchases.total()} на {digest.revenue_rub} ₽")
+            lines += self._breakdown(digest.purchases, labels)
+            lines += self._release_commands(digest.receipts)
+        if digest.submissions:
+            lines.append(f"Новые файлы на проверку: {digest.submissions.total()}")
+            lines += self._breakdown(digest.submissions, labels)
+
+        return "\n".join(lines)
+
+    def _breakdown(self, counts: Counter[uuid.UUID], labels: dict[uuid.UUID, str]) -> list[str]:
+        by_label = Counter()
+        for entity_id, count in counts.items():
+            by_label[labels.get(entity_id, "удалено из каталога")] += count
+
+        lines = [f"• {label}: {count}" for label, count in by_label.most_common(self._max_lines)]
+        if len(by_label) > self._max_lines:
+            lines.append(f"• …и ещё {len(by_label) - self._max_lines}")
+        return lines
+
+    def _release_commands(self, receipts: list[Receipt]) -> list[str]:
+        """A ready /release command per purchase, the receipt id is what the buyer quotes with the payment"""
+        lines = [f"/release {receipt.id} — {receipt.buyer_name}" for receipt in receipts[:self._max_lines]]
+        if len(receipts) > self._max_lines:
+            lines.append(f"…и ещё {len(receipts) - self._max_lines}")
+        return lines
\ No newline at end of file
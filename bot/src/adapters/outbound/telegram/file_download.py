@@ -0,0 +1,15 @@
+from collections.abc import AsyncIterator
+
+import httpx
+from telegram import Bot
+
+
+async def iter_file_chunks(bot: Bot, file_id: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Stream a file sent to the bot in chunks, without buffering it in memory or on disk"""
+    file = await bot.get_file(file_id)
+
+    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0, connect=10.0)) as client:
+        async with client.stream("GET", file.file_path) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
\ No newline at end of file
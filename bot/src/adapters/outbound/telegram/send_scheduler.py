@@ -0,0 +1,351 @@
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, BinaryIO, TypeVar
+
+from telegram import Bot
+from telegram.error import BadRequest, RetryAfter
+
+from src.core.application.exceptions import FileReferenceExpiredError
+from src.core.application.ports.outbound.messenger import MessagePriority, Messenger
+
+
+T = TypeVar("T")
+
+# Parts of the errors Telegram answers a file id it no longer accepts with
+STALE_FILE_ID_ERRORS = ("file identifier", "file reference", "file_id")
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """`rate` tokens per second, at most `capacity` saved up for bursts"""
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = now
+        self._blocked_until = 0.0
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token can be taken"""
+        self._refill(now)
+        wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+        return max(wait, self._blocked_until - now)
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self._tokens -= 1
+
+    def block_until(self, until: float) -> None:
+        self._blocked_until = max(self._blocked_until, until)
+
+    def is_idle(self, now: float) -> bool:
+        self._refill(now)
+        return self._tokens >= self._capacity and self._blocked_until <= now
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    chat_id: int = field(compare=False)
+    call: Callable[[], Awaitable[Any]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    attempts: int = field(default=0, compare=False)
+
+
+@dataclass(frozen=True)
+class SendQueueStats:
+    depth: int
+    depth_by_priority: dict[str, int]
+    in_flight: int
+    sent: int
+    retried: int
+    failed: int
+    dispatched: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    p95_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.dispatched if self.dispatched else 0.0
+
+
+class TelegramSendScheduler(Messenger):
+    """Queues outgoing Bot API calls and releases them within Telegram's flood limits.
+
+    Every call needs a token from the global bucket (~30 messages/s) and from the bucket of
+    its chat (~1 message/s with a small burst). A chat waiting for its bucket does not hold
+    up other chats, and within the limits lower `MessagePriority` values go first, so a
+    user's reply overtakes queued admin notifications and bulk deliveries.
+
+    On 429 the chat is paused for `retry_after` and the call is queued again in front of
+    that chat's other calls, up to `max_retries` times. Calls are awaited by the caller
+    (`submit` returns the call's result) but run concurrently once released.
+
+    Bookkeeping: each chat has a heap of its jobs. A chat allowed to send now has an entry
+    in `_ready` keyed by its head job; a chat waiting for tokens has one in `_throttled`
+    keyed by the time it may send. Entries are invalidated lazily via `_entries`.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        global_rate: float = 30.0,
+        chat_rate: float = 1.0,
+        chat_burst: float = 3.0,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._bot = bot
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._max_retries = max_retries
+        self._clock = clock
+
+        self._global_bucket = TokenBucket(global_rate, global_rate, clock())
+        self._chat_buckets: dict[int, TokenBucket] = {}
+        self._jobs: dict[int, list[_Job]] = {}
+        self._entries: dict[int, int] = {}
+        self._ready: list[tuple[int, int, int, int]] = []
+        self._throttled: list[tuple[float, int, int]] = []
+        self._seq = 0
+
+        self._wakeup = asyncio.Event()
+        self._dispatcher: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+        self._depth = {priority: 0 for priority in MessagePriority}
+        self._sent = 0
+        self._retried = 0
+        self._failed = 0
+        self._dispatched = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=1000)
+
+    async def submit(self, chat_id: int, call: Callable[[], Awaitable[T]], priority: MessagePriority = MessagePriority.USER) -> T:
+        """Run `call` once the rate limits allow a message to `chat_id`; returns its result"""
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        future = asyncio.get_running_loop().create_future()
+        self._push(_Job(priority, self._next_seq(), chat_id, call, future, self._clock()))
+
+        return await future
+
+    async def send_message(self, chat_id: int, text: str, priority: MessagePriority = MessagePriority.USER) -> None:
+        await self.submit(chat_id, lambda: self._bot.send_message(chat_id, text), priority)
+
+    async def send_document(
+        self,
+        chat_id: int,
+        document: str | BinaryIO,
+        filename: str | None = None,
+        caption: str | None = None,
+        priority: MessagePriority = MessagePriority.USER,
+    ) -> str:
+        async def call():
+            # A retried upload has to start from the beginning of the file again
+            if not isinstance(document, str) and document.seekable():
+                document.seek(0)
+            return await self._bot.send_document(chat_id, document, filename=filename, caption=caption)
+
+        try:
+            message = await self.submit(chat_id, call, priority)
+        except BadRequest as error:
+            if isinstance(document, str) and any(part in error.message.lower() for part in STALE_FILE_ID_ERRORS):
+                raise FileReferenceExpiredError(document) from error
+            raise
+
+        return message.document.file_id
+
+    def is_idle(self) -> bool:
+        """Nothing queued and nothing being sent"""
+        return not self._jobs and not self._in_flight
+
+    def stats(self) -> SendQueueStats:
+        waits = sorted(self._recent_waits)
+
+        return SendQueueStats(
+            depth=sum(self._depth.values()),
+            depth_by_priority={priority.name.lower(): depth for priority, depth in self._depth.items()},
+            in_flight=len(self._in_flight),
+            sent=self._sent,
+            retried=self._retried,
+            failed=self._failed,
+            dispatched=self._dispatched,
+            total_wait_seconds=self._total_wait,
+            max_wait_seconds=self._max_wait,
+            p95_wait_seconds=waits[int(len(waits) * 0.95)] if waits else 0.0,
+        )
+
+    async def close(self) -> None:
+        """Stop dispatching, let released calls finish and fail the ones still queued"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        for jobs in self._jobs.values():
+            for job in jobs:
+                if not job.future.done():
+                    job.future.set_exception(RuntimeError("Send scheduler closed"))
+        self._jobs.clear()
+        self._entries.clear()
+        self._ready.clear()
+        self._throttled.clear()
+        self._depth = {priority: 0 for priority in MessagePriority}
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def _push(self, job: _Job) -> None:
+        jobs = self._jobs.setdefault(job.chat_id, [])
+        heapq.heappush(jobs, job)
+        self._depth[job.priority] += 1
+
+        # A new head (first job, or one that outranks the queued ones) needs a fresh entry
+        if jobs[0] is job:
+            self._schedule(job.chat_id, self._clock())
+        self._wakeup.set()
+
+    def _chat_bucket(self, chat_id: int, now: float) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self._chat_rate, self._chat_burst, now)
+        return bucket
+
+    def _schedule(self, chat_id: int, now: float) -> None:
+        entry = self._entries[chat_id] = self._next_seq()
+        delay = self._chat_bucket(chat_id, now).delay(now)
+
+        if delay > 0:
+            heapq.heappush(self._throttled, (now + delay, entry, chat_id))
+        else:
+            head = self._jobs[chat_id][0]
+            heapq.heappush(self._ready, (head.priority, head.seq, entry, chat_id))
+
+    def _release_throttled(self, now: float) -> None:
+        while self._throttled and self._throttled[0][0] <= now:
+            _, entry, chat_id = heapq.heappop(self._throttled)
+            if self._entries.get(chat_id) == entry:
+                self._schedule(chat_id, now)
+
+    def _peek_ready(self) -> tuple[int, int, int, int] | None:
+        while self._ready:
+            _, _, entry, chat_id = self._ready[0]
+            if self._entries.get(chat_id) == entry:
+                return self._ready[0]
+            heapq.heappop(self._ready)
+        return None
+
+    async def _wait(self, timeout: float | None) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except TimeoutError:
+            pass
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = self._clock()
+            self._release_throttled(now)
+
+            if self._peek_ready() is None:
+                await self._wait(self._throttled[0][0] - now if self._throttled else None)
+                continue
+
+            # Sleep on the global bucket without taking an entry, a more urgent job may arrive meanwhile
+            delay = self._global_bucket.delay(now)
+            if delay > 0:
+                await self._wait(delay)
+                continue
+
+            _, _, _, chat_id = heapq.heappop(self._ready)
+            del self._entries[chat_id]
+            jobs = self._jobs[chat_id]
+            job = heapq.heappop(jobs)
+            self._depth[job.priority] -= 1
+
+            if job.future.done():
+                # The caller gave up (e.g. its handler was cancelled), nothing to send
+                pass
+            elif self._chat_bucket(chat_id, now).delay(now) > 0:
+                # Paused by a 429 after the entry was made
+                heapq.heappush(jobs, job)
+                self._depth[job.priority] += 1
+            else:
+                self._global_bucket.take(now)
+                self._chat_bucket(chat_id, now).take(now)
+                self._record_wait(job, now)
+
+                task = asyncio.create_task(self._send(job))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+            if jobs:
+                self._schedule(chat_id, now)
+            else:
+                del self._jobs[chat_id]
+
+            if len(self._chat_buckets) > 10_000:
+                self._forget_idle_chats(now)
+
+    async def _send(self, job: _Job) -> None:
+        try:
+            result = await job.call()
+        except RetryAfter as error:
+            self._retried += 1
+            if job.attempts >= self._max_retries or job.future.done():
+                self._fail(job, error)
+                return
+
+            retry_after = error.retry_after
+            seconds = retry_after.total_seconds() if isinstance(retry_after, timedelta) else retry_after
+            logger.warning("Telegram asked to retry chat %s in %ss", job.chat_id, seconds)
+
+            now = self._clock()
+            self._chat_bucket(job.chat_id, now).block_until(now + seconds)
+            job.attempts += 1
+            self._push(job)
+        except Exception as error:
+            self._fail(job, error)
+        else:
+            self._sent += 1
+            if not job.future.done():
+                job.future.set_result(result)
+
+    def _fail(self, job: _Job, error: Exception) -> None:
+        self._failed += 1
+        if not job.future.done():
+            job.future.set_exception(error)
+
+    def _record_wait(self, job: _Job, now: float) -> None:
+        if job.attempts:
+            return
+
+        wait = now - job.enqueued_at
+        self._dispatched += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        self._recent_waits.append(wait)
+
+    def _forget_idle_chats(self, now: float) -> None:
+        for chat_id in [chat_id for chat_id, bucket in self._chat_buckets.items() if chat_id not in self._jobs and bucket.is_idle(now)]:
+            del self._chat_buckets[chat_id]
@@ -0,0 +1,46 @@
+class ApplicationError(Exception):
+    pass
+
+
+class SubmissionNotFoundError(ApplicationError):
+    pass
+
+
+class SubmissionAlreadyModeratedError(ApplicationError):
+    pass
+
+
+class SubjectNotFoundError(ApplicationError):
+    pass
+
+
+class EmptyWelcomeMessageError(ApplicationError):
+    pass
+
+
+class ReceiptNotFoundError(ApplicationError):
+    pass
+
+
+class NoteFileMissingError(ApplicationError):
+    pass
+
+
+class ObjectNotFoundError(ApplicationError):
+    pass
+
+
+class FileReferenceExpiredError(ApplicationError):
+    """A file id previously returned by the messenger is no longer accepted"""
+
+
+class ReceiptJournalFullError(ApplicationError):
+    """Too many receipts are waiting to be saved, the database is not keeping up"""
+
+
+class UploadTooLargeError(ApplicationError):
+    pass
+
+
+class NotAPdfError(ApplicationError):
+    pass
\ No newline at end of file
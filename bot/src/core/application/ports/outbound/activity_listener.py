@@ -0,0 +1,16 @@
+from typing import Protocol
+
+from src.core.domain.models import Receipt, Submission
+
+
+class ActivityListener(Protocol):
+    """Receives purchases and uploads accepted by the services, e.g. to notify the admin.
+
+    May be called from worker threads.
+    """
+
+    def purchase_created(self, receipt: Receipt) -> None:
+        raise NotImplementedError
+
+    def submission_created(self, submission: Submission) -> None:
+        raise NotImplementedError
\ No newline at end of file
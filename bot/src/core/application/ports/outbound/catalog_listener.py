@@ -0,0 +1,10 @@
+from typing import Protocol
+
+from src.core.domain.models import Note, Subject
+
+
+class CatalogListener(Protocol):
+    """Receives catalog changes made by the services, e.g. to refresh in-memory views of the catalog"""
+
+    def note_saved(self, subject: Subject, note: Note) -> None:
+        raise NotImplementedError
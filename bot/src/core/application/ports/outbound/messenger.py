@@ -0,0 +1,27 @@
+from enum import IntEnum
+from typing import BinaryIO, Protocol
+
+
+class MessagePriority(IntEnum):
+    """Lower values are sent first when sends have to wait for rate limits"""
+    USER = 0
+    ADMIN = 1
+    BULK = 2
+
+
+class Messenger(Protocol):
+    """Outgoing messages to users and the admin; implementations take care of rate limits"""
+
+    async def send_message(self, chat_id: int, text: str, priority: MessagePriority = MessagePriority.USER) -> None:
+        raise NotImplementedError
+
+    async def send_document(
+        self,
+        chat_id: int,
+        document: str | BinaryIO,
+        filename: str | None = None,
+        caption: str | None = None,
+        priority: MessagePriority = MessagePriority.USER,
+    ) -> str:
+        """`document` is a previously returned file id or a file to upload; returns the file id of the sent document"""
+        raise NotImplementedError
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import BinaryIO, Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class StoredObject:
+    key: str
+    size: int
+    # False when identical content was already stored and this upload was discarded
+    created: bool
+
+
+class ObjectWriter(Protocol):
+    """Upload of one object written chunk by chunk, as a multipart upload to S3 would be.
+
+    Nothing is visible under a key before `commit`; leaving the `with` block without
+    committing aborts the upload.
+    """
+
+    def write(self, chunk: bytes) -> None:
+        raise NotImplementedError
+
+    def commit(self) -> StoredObject:
+        raise NotImplementedError
+
+    def abort(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self) -> "ObjectWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.abort()
+
+
+class ObjectStorage(Protocol):
+    """Content-addressed storage of uploaded note files.
+
+    The key of an object is the SHA-256 hex digest of its content, chosen by the storage
+    on commit, so identical uploads share one object. It is what `Note.file_key` and
+    `Submission.file_key` hold; publishing a submission only copies the key.
+    """
+
+    def writer(self) -> ObjectWriter:
+        raise NotImplementedError
+
+    def open(self, key: str) -> BinaryIO:
+        """Open the object for reading; raises ObjectNotFoundError. The caller closes the file"""
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
\ No newline at end of file
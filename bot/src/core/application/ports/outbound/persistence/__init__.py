@@ -1,6 +1,23 @@
-from .course_repository import CourseRepository
-from .subject_repository import SubjectRepository
-from .note_repository import NoteRepository
-from .receipt_repository import ReceiptRepository
+from .course_repository import CourseRepository, AsyncCourseRepository
+from .subject_repository import SubjectRepository, AsyncSubjectRepository
+from .note_repository import NoteRepository, AsyncNoteRepository
+from .receipt_repository import ReceiptRepository, AsyncReceiptRepository
+from .receipt_journal import ReceiptJournal
+from .conversation_state_store import ConversationStateStore
+from .submission_repository import SubmissionRepository
+from .unit_of_work import UnitOfWork
 
-__all__ = ["CourseRepository", "SubjectRepository", "NoteRepository", "ReceiptRepository"]
\ No newline at end of file
+__all__ = [
+    "CourseRepository",
+    "SubjectRepository",
+    "NoteRepository",
+    "ReceiptRepository",
+    "SubmissionRepository",
+    "AsyncCourseRepository",
+    "AsyncSubjectRepository",
+    "AsyncNoteRepository",
+    "AsyncReceiptRepository",
+    "ReceiptJournal",
+    "ConversationStateStore",
+    "UnitOfWork",
+]
@@ -0,0 +1,17 @@
+from typing import Any, Protocol
+
+
+class ConversationStateStore(Protocol):
+    """Where each user is in a multi-step flow (e.g. selling a note), kept across restarts.
+
+    A state is a JSON-serialisable dict; callers get a copy and save changes with `set`.
+    """
+
+    def get(self, user_id: int) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    def set(self, user_id: int, state: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def delete(self, user_id: int) -> None:
+        raise NotImplementedError
\ No newline at end of file
@@ -12,8 +12,38 @@ class CourseRepository(Protocol):
     def get_by_year(self, year: CourseYear) -> Course | None:
         raise NotImplementedError
 
+    def list_all(self) -> list[Course]:
+        """Return every course with its subjects and notes, ordered by year"""
+        raise NotImplementedError
+
     def save(self, course: Course) -> None:
         raise NotImplementedError
 
+    def save_many(self, courses: list[Course]) -> None:
+        """Insert or update courses together with their subjects and notes in bulk"""
+        raise NotImplementedError
+
     def delete(self, course_id: uuid.UUID) -> None:
+        raise NotImplementedError
+
+
+class AsyncCourseRepository(Protocol):
+    async def get_by_id(self, course_id: uuid.UUID) -> Course | None:
+        raise NotImplementedError
+
+    async def get_by_year(self, year: CourseYear) -> Course | None:
+        raise NotImplementedError
+
+    async def list_all(self) -> list[Course]:
+        """Return every course with its subjects and notes, ordered by year"""
+        raise NotImplementedError
+
+    async def save(self, course: Course) -> None:
+        raise NotImplementedError
+
+    async def save_many(self, courses: list[Course]) -> None:
+        """Insert or update courses together with their subjects and notes in bulk"""
+        raise NotImplementedError
+
+    async def delete(self, course_id: uuid.UUID) -> None:
         raise NotImplementedError
\ No newline at end of file
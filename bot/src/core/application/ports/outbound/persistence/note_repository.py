@@ -14,5 +14,35 @@ class NoteRepository(Protocol):
     def save(self, note: Note) -> None:
         raise NotImplementedError
 
+    def save_many(self, subject_id: uuid.UUID, notes: list[Note]) -> None:
+        """Insert or update notes of a subject in bulk"""
+        raise NotImplementedError
+
+    def set_telegram_file_id(self, note_id: uuid.UUID, telegram_file_id: str | None) -> None:
+        """Update only the Telegram file id, without loading the note"""
+        raise NotImplementedError
+
     def delete(self, note_id: uuid.UUID) -> None:
+        raise NotImplementedError
+
+
+class AsyncNoteRepository(Protocol):
+    async def get_by_id(self, note_id: uuid.UUID) -> Note | None:
+        raise NotImplementedError
+
+    async def get_by_title(self, title: str) -> Note | None:
+        raise NotImplementedError
+
+    async def save(self, note: Note) -> None:
+        raise NotImplementedError
+
+    async def save_many(self, subject_id: uuid.UUID, notes: list[Note]) -> None:
+        """Insert or update notes of a subject in bulk"""
+        raise NotImplementedError
+
+    async def set_telegram_file_id(self, note_id: uuid.UUID, telegram_file_id: str | None) -> None:
+        """Update only the Telegram file id, without loading the note"""
+        raise NotImplementedError
+
+    async def delete(self, note_id: uuid.UUID) -> None:
         raise NotImplementedError
\ No newline at end of file
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from src.core.domain.models import Receipt
+
+
+class ReceiptJournal(Protocol):
+    """Receipts accepted now and saved later, in batches"""
+
+    def append(self, receipt: Receipt) -> None:
+        """Accept a receipt for saving; raises ReceiptJournalFullError when the backlog is full"""
+        raise NotImplementedError
\ No newline at end of file
@@ -8,11 +8,49 @@ class ReceiptRepository(Protocol):
     def get_by_id(self, check_id: uuid.UUID) -> Receipt | None:
         raise NotImplementedError
 
+    def get_many(self, receipt_ids: list[uuid.UUID]) -> list[Receipt]:
+        """Return the receipts that exist among `receipt_ids`, in no particular order"""
+        raise NotImplementedError
+
     def get_by_buyer_id(self, buyer_id: int) -> Receipt | None:
         raise NotImplementedError
 
+    def list_by_buyer(self, buyer_id: int, after: uuid.UUID | None = None, limit: int = 20) -> list[Receipt]:
+        """Return up to `limit` receipts of a buyer, newest first, older than receipt `after`"""
+        raise NotImplementedError
+
     def save(self, check: Receipt) -> None:
         raise NotImplementedError
 
+    def save_many(self, receipts: list[Receipt]) -> None:
+        """Insert or update receipts in bulk"""
+        raise NotImplementedError
+
     def delete(self, check_id: uuid.UUID) -> None:
+        raise NotImplementedError
+
+
+class AsyncReceiptRepository(Protocol):
+    async def get_by_id(self, check_id: uuid.UUID) -> Receipt | None:
+        raise NotImplementedError
+
+    async def get_many(self, receipt_ids: list[uuid.UUID]) -> list[Receipt]:
+        """Return the receipts that exist among `receipt_ids`, in no particular order"""
+        raise NotImplementedError
+
+    async def get_by_buyer_id(self, buyer_id: int) -> Receipt | None:
+        raise NotImplementedError
+
+    async def list_by_buyer(self, buyer_id: int, after: uuid.UUID | None = None, limit: int = 20) -> list[Receipt]:
+        """Return up to `limit` receipts of a buyer, newest first, older than receipt `after`"""
+        raise NotImplementedError
+
+    async def save(self, check: Receipt) -> None:
+        raise NotImplementedError
+
+    async def save_many(self, receipts: list[Receipt]) -> None:
+        """Insert or update receipts in bulk"""
+        raise NotImplementedError
+
+    async def delete(self, check_id: uuid.UUID) -> None:
         raise NotImplementedError
\ No newline at end of file
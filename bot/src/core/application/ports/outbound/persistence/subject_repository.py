@@ -14,5 +14,27 @@ class SubjectRepository(Protocol):
     def save(self, subject: Subject) -> None:
         raise NotImplementedError
 
+    def save_many(self, course_id: uuid.UUID, subjects: list[Subject]) -> None:
+        """Insert or update subjects of a course together with their notes in bulk"""
+        raise NotImplementedError
+
     def delete(self, subject_id: uuid.UUID) -> None:
+        raise NotImplementedError
+
+
+class AsyncSubjectRepository(Protocol):
+    async def get_by_id(self, subject_id: uuid.UUID) -> Subject | None:
+        raise NotImplementedError
+
+    async def get_by_name(self, name: str) -> Subject | None:
+        raise NotImplementedError
+
+    async def save(self, subject: Subject) -> None:
+        raise NotImplementedError
+
+    async def save_many(self, course_id: uuid.UUID, subjects: list[Subject]) -> None:
+        """Insert or update subjects of a course together with their notes in bulk"""
+        raise NotImplementedError
+
+    async def delete(self, subject_id: uuid.UUID) -> None:
         raise NotImplementedError
\ No newline at end of file
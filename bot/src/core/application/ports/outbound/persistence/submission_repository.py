@@ -0,0 +1,19 @@
+import uuid
+from typing import Protocol
+
+from src.core.domain.models import Submission
+
+
+class SubmissionRepository(Protocol):
+    def get_by_id(self, submission_id: uuid.UUID) -> Submission | None:
+        raise NotImplementedError
+
+    def list_pending(self, after: uuid.UUID | None = None, limit: int = 20) -> list[Submission]:
+        """Return up to `limit` pending submissions, oldest first, newer than submission `after`"""
+        raise NotImplementedError
+
+    def save(self, submission: Submission) -> None:
+        raise NotImplementedError
+
+    def delete(self, submission_id: uuid.UUID) -> None:
+        raise NotImplementedError
@@ -0,0 +1,33 @@
+from typing import Protocol, Self
+
+from .course_repository import CourseRepository
+from .subject_repository import SubjectRepository
+from .note_repository import NoteRepository
+from .receipt_repository import ReceiptRepository
+from .submission_repository import SubmissionRepository
+
+
+class UnitOfWork(Protocol):
+    """Repositories sharing one session and one transaction.
+
+    Nothing is persisted unless `commit` is called before the block exits;
+    leaving the block without committing rolls the transaction back.
+    """
+
+    courses: CourseRepository
+    subjects: SubjectRepository
+    notes: NoteRepository
+    receipts: ReceiptRepository
+    submissions: SubmissionRepository
+
+    def __enter__(self) -> Self:
+        raise NotImplementedError
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        raise NotImplementedError
+
+    def commit(self) -> None:
+        raise NotImplementedError
+
+    def rollback(self) -> None:
+        raise NotImplementedError
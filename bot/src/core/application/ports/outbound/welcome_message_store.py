@@ -0,0 +1,12 @@
+from typing import Protocol
+
+
+class WelcomeMessageStore(Protocol):
+    """Text shown on /start and when returning to the main menu"""
+
+    def get(self) -> str:
+        """Called on every /start and "back" tap, so implementations should answer from memory"""
+        raise NotImplementedError
+
+    def set(self, text: str) -> None:
+        raise NotImplementedError
@@ -0,0 +1,48 @@
+import uuid
+from dataclasses import replace
+from collections.abc import Callable, Iterable
+from ..exceptions import SubjectNotFoundError, SubmissionAlreadyModeratedError, SubmissionNotFoundError
+from ..ports.outbound.catalog_listener import CatalogListener
+from ..ports.outbound.persistence import UnitOfWork
+from src.core.domain.common.enums import SubmissionStatus
+from src.core.domain.models import Note, Subject
+
+
+class AdminConfirmService:
+    def __init__(self, unit_of_work: Callable[[], UnitOfWork], listeners: Iterable[CatalogListener] = ()):
+        self._unit_of_work = unit_of_work
+        self._listeners = list(listeners)
+
+    def confirm(self, submission_id: uuid.UUID) -> Note:
+        """Publish a pending submission as a note of its subject"""
+        subject, note = self.publish(submission_id)
+        self.notify(subject, note)
+        return note
+
+    def publish(self, submission_id: uuid.UUID) -> tuple[Subject, Note]:
+        """The database part of `confirm`: returns the subject with the new note, for `notify`"""
+        with self._unit_of_work() as uow:
+            submission = uow.submissions.get_by_id(submission_id)
+
+            if not submission:
+                raise SubmissionNotFoundError(submission_id)
+            if submission.status != SubmissionStatus.PENDING:
+                raise SubmissionAlreadyModeratedError(submission_id)
+
+            subject = uow.subjects.get_by_id(submission.subject_id)
+            if not subject:
+                raise SubjectNotFoundError(submission.subject_id)
+
+            note = Note(title=submission.title, file_key=submission.file_key)
+            submission = replace(submission, status=SubmissionStatus.CONFIRMED)
+
+            uow.notes.save_many(subject.id, [note])
+            uow.submissions.save(submission)
+            uow.commit()
+
+        return replace(subject, notes=(*subject.notes, note)), note
+
+    def notify(self, subject: Subject, note: Note) -> None:
+        """Tell the listeners about a published note; call from the thread that owns them"""
+        for listener in self._listeners:
+            listener.note_saved(subject, note)
@@ -0,0 +1,20 @@
+import uuid
+from ..ports.outbound.persistence import SubmissionRepository
+from src.core.domain.models import Submission
+
+
+class AdminListPendingService:
+    def __init__(self, submission_repository: SubmissionRepository, page_size: int = 20):
+        self._submission_repository = submission_repository
+        self._page_size = page_size
+
+    def list_pending(self, after: uuid.UUID | None = None) -> tuple[list[Submission], uuid.UUID | None]:
+        """Return a page of the moderation queue and the cursor of the next page (None on the last one)"""
+        # One extra row tells whether there is a next page without a COUNT over the queue
+        submissions = self._submission_repository.list_pending(after=after, limit=self._page_size + 1)
+
+        if len(submissions) > self._page_size:
+            page = submissions[:self._page_size]
+            return page, page[-1].id
+
+        return submissions, None
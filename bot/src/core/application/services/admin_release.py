@@ -0,0 +1,155 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, replace
+from ..exceptions import FileReferenceExpiredError, NoteFileMissingError, ReceiptNotFoundError
+from ..ports.outbound.messenger import MessagePriority, Messenger
+from ..ports.outbound.object_storage import ObjectStorage
+from ..ports.outbound.persistence import AsyncNoteRepository, AsyncReceiptRepository
+from src.core.domain.models import Note, Receipt
+
+
+@dataclass(frozen=True, slots=True)
+class ReleaseResult:
+    receipt_id: uuid.UUID
+    # None when the receipt does not exist
+    buyer_id: int | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AdminReleaseService:
+    def __init__(
+        self,
+        receipt_repository: AsyncReceiptRepository,
+        note_repository: AsyncNoteRepository,
+        object_storage: ObjectStorage,
+        messenger: Messenger,
+        max_concurrent_deliveries: int = 8,
+    ):
+        self._receipt_repository = receipt_repository
+        self._note_repository = note_repository
+        self._object_storage = object_storage
+        self._messenger = messenger
+        self._max_concurrent_deliveries = max_concurrent_deliveries
+        # Rejected file id -> its replacement, None while the upload is in flight. Kept once
+        # done so deliveries of notes loaded before the upload skip straight to the new id
+        self._renewals: dict[str, asyncio.Future[str | None]] = {}
+
+    async def release(self, receipt_id: uuid.UUID) -> Receipt:
+        """Send the purchased note to the buyer of a paid receipt"""
+        receipt = await self._receipt_repository.get_by_id(receipt_id)
+        if not receipt:
+            raise ReceiptNotFoundError(receipt_id)
+
+        await self.deliver(receipt.buyer_id, receipt.note)
+        return receipt
+
+    async def release_many(self, receipt_ids: list[uuid.UUID]) -> list[ReleaseResult]:
+        """Release a batch of receipts; one result per id, in the order given.
+
+        Receipts and their notes come in one round trip. Deliveries run concurrently, at
+        most `max_concurrent_deliveries` at a time (the messenger still applies Telegram's
+        rate limits). A note without a Telegram file id is uploaded once: its other buyers
+        wait for the first successful delivery and then get it by file id.
+        """
+        receipt_ids = list(dict.fromkeys(receipt_ids))
+        receipts = {receipt.id: receipt for receipt in await self._receipt_repository.get_many(receipt_ids)}
+
+        by_note: dict[uuid.UUID, list[Receipt]] = {}
+        for receipt_id in receipt_ids:
+            if receipt_id in receipts:
+                by_note.setdefault(receipts[receipt_id].note.id, []).append(receipts[receipt_id])
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_deliveries)
+        results: dict[uuid.UUID, ReleaseResult] = {}
+
+        async def deliver(receipt: Receipt, note: Note) -> Note | None:
+            """The note as delivered (with its file id), None when the delivery failed"""
+            async with semaphore:
+                try:
+                    telegram_file_id = await self.deliver(receipt.buyer_id, note)
+                except Exception as error:
+                    # One blocked bot or missing file must not stop the rest of the batch
+                    results[receipt.id] = ReleaseResult(receipt.id, receipt.buyer_id, error)
+                    return None
+
+            results[receipt.id] = ReleaseResult(receipt.id, receipt.buyer_id)
+            return replace(note, telegram_file_id=telegram_file_id)
+
+        async def release_note(note_receipts: list[Receipt]) -> None:
+            note = note_receipts[0].note
+            pending = list(note_receipts)
+
+            while pending and not note.telegram_file_id:
+                delivered = await deliver(pending.pop(0), note)
+                if delivered:
+                    note = delivered
+
+            await asyncio.gather(*(deliver(receipt, note) for receipt in pending))
+
+        await asyncio.gather(*(release_note(note_receipts) for note_receipts in by_note.values()))
+
+        return [
+            results.get(receipt_id) or ReleaseResult(receipt_id, error=ReceiptNotFoundError(receipt_id))
+            for receipt_id in receipt_ids
+        ]
+
+    async def deliver(self, chat_id: int, note: Note) -> str:
+        """Send by the Telegram file id when the note has one, upload the file otherwise.
+
+        The first upload stores the file id Telegram returns, so later deliveries of the
+        same note transfer no bytes. A file id Telegram no longer accepts is replaced by
+        uploading again, once for all deliveries that run into it. Returns the file id the
+        note was sent with.
+        """
+        if note.file_key is None:
+            raise NoteFileMissingError(note.id)
+
+        if not note.telegram_file_id:
+            return await self._upload(chat_id, note)
+
+        renewal = self._renewals.get(note.telegram_file_id)
+        if renewal is None or not renewal.done() or renewal.result() is None:
+            try:
+                await self._messenger.send_document(chat_id, note.telegram_file_id, priority=MessagePriority.BULK)
+                return note.telegram_file_id
+            except FileReferenceExpiredError:
+                pass
+
+        return await self._deliver_renewed(chat_id, note)
+
+    async def _deliver_renewed(self, chat_id: int, note: Note) -> str:
+        """The first delivery to find the file id rejected uploads the file, the others wait and send the new id.
+
+        If that upload fails (e.g. its buyer blocked the bot), the next waiting delivery uploads instead.
+        """
+        stale_file_id = note.telegram_file_id
+
+        while (renewal := self._renewals.get(stale_file_id)) is not None:
+            # Shielded: a waiter being cancelled must not cancel the upload shared with the others
+            telegram_file_id = await asyncio.shield(renewal)
+            if telegram_file_id is not None:
+                await self._messenger.send_document(chat_id, telegram_file_id, priority=MessagePriority.BULK)
+                return telegram_file_id
+
+        renewal = self._renewals[stale_file_id] = asyncio.get_running_loop().create_future()
+        telegram_file_id = None
+        try:
+            telegram_file_id = await self._upload(chat_id, note)
+            return telegram_file_id
+        finally:
+            if telegram_file_id is None:
+                del self._renewals[stale_file_id]
+            renewal.set_result(telegram_file_id)
+
+    async def _upload(self, chat_id: int, note: Note) -> str:
+        with self._object_storage.open(note.file_key) as file:
+            telegram_file_id = await self._messenger.send_document(
+                chat_id, file, filename=f"{note.title}.pdf", priority=MessagePriority.BULK
+            )
+
+        await self._note_repository.set_telegram_file_id(note.id, telegram_file_id)
+        return telegram_file_id
\ No newline at end of file
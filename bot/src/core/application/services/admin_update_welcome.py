@@ -0,0 +1,14 @@
+from ..exceptions import EmptyWelcomeMessageError
+from ..ports.outbound.welcome_message_store import WelcomeMessageStore
+
+
+class AdminUpdateWelcomeService:
+    def __init__(self, welcome_message_store: WelcomeMessageStore):
+        self._welcome_message_store = welcome_message_store
+
+    def update(self, text: str) -> None:
+        text = text.strip()
+        if not text:
+            raise EmptyWelcomeMessageError()
+
+        self._welcome_message_store.set(text)
@@ -0,0 +1,101 @@
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from ..ports.outbound.persistence import CourseRepository
+from src.core.domain.common.enums import CourseYear
+from src.core.domain.common.facades import uuid7
+from src.core.domain.models import Course, Note, Subject
+
+
+@dataclass(frozen=True)
+class CatalogRow:
+    year: CourseYear
+    subject: str
+    note: str | None = None
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    duplicates: int = 0
+    courses_created: int = 0
+    subjects_created: int = 0
+    notes_created: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class ImportCatalogService:
+    def __init__(self, course_repository: CourseRepository):
+        self._course_repository = course_repository
+
+    def import_rows(self, rows: Iterable[CatalogRow]) -> ImportReport:
+        """Add missing courses, subjects and notes from rows; existing entries are kept as is.
+
+        The existing catalog is loaded once and the diff is computed with hash lookups,
+        so only new entities are written, in a single bulk save.
+        """
+        started = time.perf_counter()
+        report = ImportReport()
+
+        course_ids: dict[CourseYear, uuid.UUID] = {}
+        subject_ids: dict[tuple[CourseYear, str], uuid.UUID] = {}
+        notes: set[tuple[CourseYear, str, str]] = set()
+
+        for course in self._course_repository.list_all():
+            course_ids[course.year] = course.id
+            for subject in course.subjects:
+                subject_ids[(course.year, subject.name)] = subject.id
+                notes.update((course.year, subject.name, note.title) for note in subject.notes)
+
+        # Only new entities end up here; existing parents are referenced without their children
+        new_notes: dict[CourseYear, dict[str, list[Note]]] = {}
+        created_ids: set[uuid.UUID] = set()
+        seen: set[CatalogRow] = set()
+
+        for row in rows:
+            report.rows += 1
+
+            row = CatalogRow(year=row.year, subject=row.subject.strip(), note=row.note.strip() if row.note else None)
+            if row in seen or not row.subject:
+                report.duplicates += 1
+                continue
+            seen.add(row)
+
+            if row.year not in course_ids:
+                course_ids[row.year] = uuid7()
+                created_ids.add(course_ids[row.year])
+                report.courses_created += 1
+
+            subject_key = (row.year, row.subject)
+            if subject_key not in subject_ids:
+                subject_ids[subject_key] = uuid7()
+                created_ids.add(subject_ids[subject_key])
+                report.subjects_created += 1
+
+            subject_notes = new_notes.setdefault(row.year, {}).setdefault(row.subject, [])
+            if row.note and (row.year, row.subject, row.note) not in notes:
+                notes.add((row.year, row.subject, row.note))
+                subject_notes.append(Note(title=row.note))
+                report.notes_created += 1
+
+        # Existing subjects without new notes and existing courses without such subjects need no writes
+        changed = []
+        for year, subjects in new_notes.items():
+            changed_subjects = tuple(
+                Subject(id=subject_ids[(year, name)], name=name, notes=tuple(subject_notes))
+                for name, subject_notes in subjects.items()
+                if subject_notes or subject_ids[(year, name)] in created_ids
+            )
+            if changed_subjects or course_ids[year] in created_ids:
+                changed.append(Course(id=course_ids[year], year=year, subjects=changed_subjects))
+
+        if changed:
+            self._course_repository.save_many(changed)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
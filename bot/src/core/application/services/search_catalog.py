@@ -0,0 +1,40 @@
+from ..ports.outbound.catalog_listener import CatalogListener
+from ..ports.outbound.persistence import CourseRepository
+from src.core.domain.models import Note, Subject
+from src.core.domain.services.title_index import EntryKind, SearchEntry, TitleIndex
+
+
+class SearchCatalogService(CatalogListener):
+    """Autocomplete over subject and note titles served from memory.
+
+    The index is built from the catalog once (`rebuild`) and kept current through
+    `note_saved`, so queries never reach the database.
+    """
+
+    def __init__(self, course_repository: CourseRepository, index: TitleIndex | None = None):
+        self._course_repository = course_repository
+        self._index = index or TitleIndex()
+
+    def rebuild(self) -> None:
+        entries = []
+
+        for course in self._course_repository.list_all():
+            for subject in course.subjects:
+                entries.append(subject_entry(subject))
+                entries.extend(note_entry(subject, note) for note in subject.notes)
+
+        self._index.rebuild(entries)
+
+    def search(self, query: str, limit: int = 20) -> list[SearchEntry]:
+        return self._index.search(query, limit)
+
+    def note_saved(self, subject: Subject, note: Note) -> None:
+        self._index.add(note_entry(subject, note))
+
+
+def subject_entry(subject: Subject) -> SearchEntry:
+    return SearchEntry(kind=EntryKind.SUBJECT, id=subject.id, title=subject.name, subject_id=subject.id, subject_name=subject.name)
+
+
+def note_entry(subject: Subject, note: Note) -> SearchEntry:
+    return SearchEntry(kind=EntryKind.NOTE, id=note.id, title=note.title, subject_id=subject.id, subject_name=subject.name)
@@ -0,0 +1,103 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterable, Callable, Iterable
+from ..exceptions import NotAPdfError, SubjectNotFoundError, UploadTooLargeError
+from ..ports.outbound.activity_listener import ActivityListener
+from ..ports.outbound.object_storage import ObjectStorage, StoredObject
+from ..ports.outbound.persistence import UnitOfWork
+from src.core.domain.models import Submission
+
+
+PDF_HEADER = b"%PDF-"
+PDF_TRAILER = b"%%EOF"
+# Writers may put line breaks or padding after the final %%EOF, so it is looked for near the end
+PDF_TRAILER_WINDOW = 1024
+
+
+class SellNotesService:
+    def __init__(
+        self,
+        unit_of_work: Callable[[], UnitOfWork],
+        object_storage: ObjectStorage,
+        max_file_size: int,
+        listeners: Iterable[ActivityListener] = (),
+    ):
+        self._unit_of_work = unit_of_work
+        self._object_storage = object_storage
+        self._max_file_size = max_file_size
+        self._listeners = list(listeners)
+
+    async def upload(self, chunks: AsyncIterable[bytes], declared_size: int | None = None) -> StoredObject:
+        """Stream a seller's PDF straight into storage, checking it as the bytes arrive.
+
+        The storage hashes the content while writing, so the file is read once. A file over
+        the size limit is rejected as soon as the limit is passed (or before downloading, by
+        `declared_size`), one that does not start with a PDF header after its first bytes.
+        Raises UploadTooLargeError or NotAPdfError; nothing is stored then, and `chunks` is
+        closed so a rejected download does not keep its connection open.
+        """
+        try:
+            return await self._store(chunks, declared_size)
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def _store(self, chunks: AsyncIterable[bytes], declared_size: int | None) -> StoredObject:
+        if declared_size is not None and declared_size > self._max_file_size:
+            raise UploadTooLargeError(declared_size)
+
+        size = 0
+        head = b""
+        tail = b""
+
+        with self._object_storage.writer() as writer:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > self._max_file_size:
+                    raise UploadTooLargeError(size)
+
+                if len(head) < len(PDF_HEADER):
+                    head += chunk[:len(PDF_HEADER) - len(head)]
+                    if not PDF_HEADER.startswith(head):
+                        raise NotAPdfError()
+
+                # Disk writes block, keep them off the event loop like the commit below
+                await asyncio.to_thread(writer.write, chunk)
+                tail = (tail + chunk[-PDF_TRAILER_WINDOW:])[-PDF_TRAILER_WINDOW:]
+
+            if head != PDF_HEADER or PDF_TRAILER not in tail:
+                raise NotAPdfError()
+
+            # Committing syncs the file to disk, keep that off the event loop
+            return await asyncio.to_thread(writer.commit)
+
+    def submit(
+        self,
+        uploader_id: int,
+        uploader_name: str,
+        subject_id: uuid.UUID,
+        title: str,
+        payment_details: str,
+        file_key: str,
+    ) -> Submission:
+        """Put an uploaded file into the moderation queue"""
+        with self._unit_of_work() as uow:
+            if not uow.subjects.get_by_id(subject_id):
+                raise SubjectNotFoundError(subject_id)
+
+            submission = Submission(
+                uploader_id=uploader_id,
+                uploader_name=uploader_name,
+                subject_id=subject_id,
+                title=title,
+                payment_details=payment_details,
+                file_key=file_key,
+            )
+            uow.submissions.save(submission)
+            uow.commit()
+
+        for listener in self._listeners:
+            listener.submission_created(submission)
+
+        return submission
\ No newline at end of file
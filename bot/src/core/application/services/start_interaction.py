@@ -1,14 +1,15 @@
+from ..ports.outbound.welcome_message_store import WelcomeMessageStore
 from src.core.domain.common.enums import StartActions
 
 
 class StartInteractionService:
-    def __init__(self, welcome_message: str):
-        self._welcome_message = welcome_message
+    def __init__(self, welcome_message_store: WelcomeMessageStore):
+        self._welcome_message_store = welcome_message_store
 
     def get_start_data(self):
         actions = list(StartActions)
 
         return {
-            "message": self._welcome_message,
+            "message": self._welcome_message_store.get(),
             "actions": actions
         }
\ No newline at end of file
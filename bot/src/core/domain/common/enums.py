@@ -13,4 +13,10 @@ class CourseYear(Enum):
 class StartActions(StrEnum):
     BUY = "Купить",
     SELL = "Продать",
-    ABOUT = "О нас"
\ No newline at end of file
+    ABOUT = "О нас"
+
+
+class SubmissionStatus(StrEnum):
+    PENDING = "pending"
+    CONFIRMED = "confirmed"
+    REJECTED = "rejected"
\ No newline at end of file
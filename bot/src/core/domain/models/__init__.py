@@ -2,5 +2,6 @@ from .subject import Subject
 from .course import Course
 from .note import Note
 from .receipt import Receipt
+from .submission import Submission
 
-__all__ = ["Subject", "Course", "Note", "Receipt"]
\ No newline at end of file
+__all__ = ["Subject", "Course", "Note", "Receipt", "Submission"]
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from ..common.facades import uuid7
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, weakref_slot=True, kw_only=True)
 class BaseModel:
+    """Immutable, so one instance can be shared by all readers; use `dataclasses.replace` to derive changes"""
     id: uuid.UUID = field(default_factory=uuid7)
\ No newline at end of file
@@ -5,7 +5,7 @@ from .subject import Subject
 from ..common.enums import CourseYear
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Course(BaseModel):
     year: CourseYear
-    subjects: list[Subject]
\ No newline at end of file
+    subjects: tuple[Subject, ...]
\ No newline at end of file
@@ -3,6 +3,10 @@ from dataclasses import dataclass
 from .base_model import BaseModel
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Note(BaseModel):
-    title: str
\ No newline at end of file
+    title: str
+    # Storage key of the PDF, None for catalog entries nobody has uploaded yet
+    file_key: str | None = None
+    # Id Telegram assigned to the file on its first upload; re-sending by id needs no upload
+    telegram_file_id: str | None = None
\ No newline at end of file
@@ -4,7 +4,7 @@ from .base_model import BaseModel
 from .note import Note
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Receipt(BaseModel):
     buyer_id: int
     buyer_name: str
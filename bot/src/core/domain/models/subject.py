@@ -4,7 +4,7 @@ from .base_model import BaseModel
 from .note import Note
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Subject(BaseModel):
     name: str
-    notes: list[Note]
\ No newline at end of file
+    notes: tuple[Note, ...]
\ No newline at end of file
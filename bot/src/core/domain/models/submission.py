@@ -0,0 +1,17 @@
+import uuid
+from dataclasses import dataclass
+
+from .base_model import BaseModel
+from ..common.enums import SubmissionStatus
+
+
+@dataclass(frozen=True, slots=True)
+class Submission(BaseModel):
+    """Note uploaded by a seller and waiting for moderation"""
+    uploader_id: int
+    uploader_name: str
+    subject_id: uuid.UUID
+    title: str
+    payment_details: str
+    file_key: str
+    status: SubmissionStatus = SubmissionStatus.PENDING
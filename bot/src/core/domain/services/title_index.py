@@ -0,0 +1,178 @@
+import bisect
+import heapq
+import re
+import uuid
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class EntryKind(StrEnum):
+    SUBJECT = "subject"
+    NOTE = "note"
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    kind: EntryKind
+    id: uuid.UUID
+    title: str
+    subject_id: uuid.UUID
+    subject_name: str
+
+
+_WORD = re.compile(r"\w+")
+# Sorts after every character that can appear in a token, closes a prefix range
+_MAX_CHAR = "\U0010ffff"
+
+
+def normalize(text: str) -> str:
+    return text.casefold().replace("ё", "е")
+
+
+def tokenize(text: str) -> list[str]:
+    return _WORD.findall(normalize(text))
+
+
+def trigrams(token: str) -> set[str]:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class TitleIndex:
+    """In-memory autocomplete index over subject and note titles.
+
+    Query words are matched against title words using a sorted token list: the last
+    word as a prefix (it is still being typed), the others as whole words. When that
+    finds too little, words of 3+ characters are also matched anywhere inside titles
+    through a trigram index. Searching never scans all entries: candidates come from
+    the narrowest word, are checked against the others, and collection stops after
+    `max_candidates` matches, so even a one-letter query costs a bounded amount of work.
+    """
+
+    def __init__(self, max_candidates: int = 200):
+        self._max_candidates = max_candidates
+        self._reset()
+
+    def _reset(self) -> None:
+        self._entries: list[SearchEntry | None] = []
+        self._entry_tokens: list[frozenset[str]] = []
+        self._normalized_titles: list[str] = []
+        self._position_by_id: dict[uuid.UUID, int] = {}
+        self._tokens: list[tuple[str, int]] = []
+        self._positions_by_trigram: dict[str, set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._position_by_id)
+
+    def rebuild(self, entries: list[SearchEntry]) -> None:
+        self._reset()
+
+        # Better ranked entries get lower positions and so come first within a token's range,
+        # which keeps them among the candidates when collection stops early
+        for entry in sorted(entries, key=lambda entry: (entry.kind != EntryKind.SUBJECT, len(entry.title))):
+            self._append(entry)
+
+        self._tokens.sort()
+
+    def add(self, entry: SearchEntry) -> None:
+        """Add or replace a single entry, e.g. a freshly confirmed note"""
+        position = self._position_by_id.get(entry.id)
+        if position is not None:
+            # Tombstone: stale tokens keep pointing here and are skipped on search
+            self._entries[position] = None
+
+        for token_position in self._append(entry):
+            bisect.insort(self._tokens, token_position)
+
+    def search(self, query: str, limit: int = 20) -> list[SearchEntry]:
+        words = tokenize(query)
+        if not words:
+            return []
+
+        partial = None if query[-1:].isspace() else words[-1]
+        complete = words if partial is None else words[:-1]
+
+        positions = self._prefix_matches(complete, partial)
+        if len(positions) < limit:
+            positions |= self._infix_matches(words)
+
+        normalized_query = normalize(query.strip())
+
+        # Titles starting with the query first, then subjects before notes, then shorter titles
+        best = heapq.nsmallest(limit, positions, key=lambda position: (
+            not self._normalized_titles[position].startswith(normalized_query),
+            self._entries[position].kind != EntryKind.SUBJECT,
+            len(self._normalized_titles[position]),
+            self._normalized_titles[position],
+        ))
+        return [self._entries[position] for position in best]
+
+    def _append(self, entry: SearchEntry) -> list[tuple[str, int]]:
+        position = len(self._entries)
+        tokens = frozenset(tokenize(entry.title))
+
+        self._entries.append(entry)
+        self._entry_tokens.append(tokens)
+        self._normalized_titles.append(normalize(entry.title))
+        self._position_by_id[entry.id] = position
+
+        token_positions = [(token, position) for token in tokens]
+        self._tokens.extend(token_positions)
+
+        for token in tokens:
+            for trigram in trigrams(token):
+                self._positions_by_trigram.setdefault(trigram, set()).add(position)
+
+        return token_positions
+
+    def _token_range(self, word: str, prefix: bool) -> tuple[int, int]:
+        return (
+            bisect.bisect_left(self._tokens, (word,)),
+            bisect.bisect_left(self._tokens, (word + _MAX_CHAR,) if prefix else (word, len(self._entries))),
+        )
+
+    def _prefix_matches(self, complete: list[str], partial: str | None) -> set[int]:
+        ranges = [self._token_range(word, prefix=False) for word in complete]
+        if partial is not None:
+            ranges.append(self._token_range(partial, prefix=True))
+        start, end = min(ranges, key=lambda bounds: bounds[1] - bounds[0])
+
+        matches = set()
+        for index in range(start, end):
+            position = self._tokens[index][1]
+            if self._entries[position] is None:
+                continue
+
+            tokens = self._entry_tokens[position]
+            if all(word in tokens for word in complete) and (
+                partial is None or any(token.startswith(partial) for token in tokens)
+            ):
+                matches.add(position)
+                if len(matches) >= self._max_candidates:
+                    break
+
+        return matches
+
+    def _infix_matches(self, words: list[str]) -> set[int]:
+        if any(len(word) < 3 for word in words):
+            return set()
+
+        candidates: set[int] | None = None
+        for trigram in sorted({trigram for word in words for trigram in trigrams(word)},
+                              key=lambda trigram: len(self._positions_by_trigram.get(trigram, ()))):
+            positions = self._positions_by_trigram.get(trigram, set())
+            candidates = positions.copy() if candidates is None else candidates & positions
+            if not candidates:
+                return set()
+
+        matches = set()
+        for position in candidates:
+            if self._entries[position] is None:
+                continue
+
+            tokens = self._entry_tokens[position]
+            if all(any(word in token for token in tokens) for word in words):
+                matches.add(position)
+                if len(matches) >= self._max_candidates:
+                    break
+
+        return matches
@@ -5,7 +5,7 @@ from pydantic import (
 )
 import json
 import pathlib
-from typing import Any
+from typing import Any, Literal
 
 
 class Settings(BaseSettings):
@@ -19,26 +19,80 @@ class Settings(BaseSettings):
     @property
     def POSTGRES_DSN(self) -> PostgresDsn:
         return PostgresDsn.build(
-            scheme="postgresql+psycopg3",
-            user=self.POSTGRES_USER,
+            scheme="postgresql+psycopg",
+            username=self.POSTGRES_USER,
             password=self.POSTGRES_PASSWORD,
             host=self.POSTGRES_HOST,
             port=self.POSTGRES_PORT,
             path=self.POSTGRES_DB
         )
 
-    TELEGRAM_ADMIN_ID: int
-
     @computed_field
     @property
-    def TELEGRAM_WELCOME_MESSAGE(self) -> str:
-        welcome_message_file_path = pathlib.Path(__file__).parent.parent.parent / "assets" / "welcome.txt"
-        if welcome_message_file_path.exists():
-            with open(welcome_message_file_path) as f:
-                return f.read()
-        return "Welcome to the Notes Bot!"
+    def POSTGRES_ASYNC_DSN(self) -> PostgresDsn:
+        return PostgresDsn.build(
+            scheme="postgresql+asyncpg",
+            username=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_HOST,
+            port=self.POSTGRES_PORT,
+            path=self.POSTGRES_DB
+        )
+
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Logs every SQL statement, for debugging only
+    DB_ECHO: bool = False
+
+    CATALOG_CACHE_MAX_SIZE: int = 1024
+    CATALOG_CACHE_TTL_SECONDS: float = 300.0
+
+    TELEGRAM_TOKEN: str
+    TELEGRAM_ADMIN_ID: int
+    # Key of the HMAC tag in callback_data, defaults to the bot token
+    TELEGRAM_CALLBACK_SECRET: str | None = None
+
+    # "polling" asks Telegram for updates, "webhook" serves an ASGI endpoint Telegram pushes updates to
+    TELEGRAM_MODE: Literal["polling", "webhook"] = "polling"
+    TELEGRAM_CONCURRENT_UPDATES: int = 64
+    # Public URL registered with Telegram on startup; leave empty to register it elsewhere (or not at all locally)
+    TELEGRAM_WEBHOOK_URL: str | None = None
+    TELEGRAM_WEBHOOK_SECRET: str | None = None
+    TELEGRAM_WEBHOOK_PATH: str = "/telegram/webhook"
+    TELEGRAM_WEBHOOK_HOST: str = "0.0.0.0"
+    TELEGRAM_WEBHOOK_PORT: int = 8080
+
+    # Served from memory and reloaded when the file changes, see FileWelcomeMessageStore
+    TELEGRAM_WELCOME_MESSAGE_PATH: pathlib.Path = pathlib.Path(__file__).parent.parent.parent / "assets" / "welcome.txt"
+    TELEGRAM_WELCOME_MESSAGE_DEFAULT: str = "Welcome to the Notes Bot!"
 
     PAYMENT_DETAILS: str
+    # Recorded on receipts; the amount to pay is announced in PAYMENT_DETAILS
+    NOTE_PRICE_RUB: int = 0
+
+    # Purchases are saved in batches of up to MAX_BATCH receipts, at most FLUSH_INTERVAL after they happen
+    RECEIPT_JOURNAL_FLUSH_INTERVAL_SECONDS: float = 0.5
+    RECEIPT_JOURNAL_MAX_BATCH: int = 100
+    # Purchases are refused once this many receipts wait for an unavailable database
+    RECEIPT_JOURNAL_MAX_BUFFER: int = 10_000
+
+    # In-flight conversations (e.g. a sale between upload and payment details) are written this often
+    CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS: float = 1.0
+    CONVERSATION_STATE_MAX_BATCH: int = 200
+    CONVERSATION_STATE_MAX_AGE_DAYS: int = 7
+
+    # Purchases and uploads are reported to the admin at most once per window, see AdminDigestNotifier
+    ADMIN_DIGEST_WINDOW_SECONDS: float = 300.0
+    # Deliveries of a /release batch in flight at once; Telegram's rate limits apply on top
+    ADMIN_RELEASE_CONCURRENCY: int = 8
+
+    # Uploaded note files
+    OBJECT_STORAGE_ROOT: pathlib.Path = pathlib.Path(__file__).parent.parent.parent / "data" / "notes"
+    # Telegram does not let bots download files over 20 MB anyway
+    UPLOAD_MAX_FILE_SIZE: int = 20 * 1024 * 1024
 
     LOGGER_NAME: str = "notes_bot"
     LOGGER_LOGFILE_NAME: str = "notes_bot.log"
@@ -1,22 +1,73 @@
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import create_engine, Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .config import settings
+from .pool_stats import MonitoredAsyncAdaptedQueuePool, MonitoredQueuePool, PoolStats, monitor_pool
 # Import of models is needed for SQLModel to generate tables from metadata
 import src.adapters.outbound.persistence.models # noqa: F401
 
 
-engine = create_engine(settings.POSTGRES_DSN, echo=True)
+engine_options = {
+    "echo": settings.DB_ECHO,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
+engine = create_engine(str(settings.POSTGRES_DSN), poolclass=MonitoredQueuePool, **engine_options)
+async_engine = create_async_engine(
+    str(settings.POSTGRES_ASYNC_DSN), poolclass=MonitoredAsyncAdaptedQueuePool, **engine_options
+)
+
+pool_monitor = monitor_pool(engine)
+async_pool_monitor = monitor_pool(async_engine.sync_engine)
+
+def get_pool_stats() -> dict[str, PoolStats]:
+    return {"sync": pool_monitor.snapshot(), "async": async_pool_monitor.snapshot()}
 
 def create_db_and_tables() -> None:
     SQLModel.metadata.create_all(engine)
 
+async def create_db_and_tables_async() -> None:
+    async with async_engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+
+def new_session() -> Session:
+    return Session(engine)
+
+def new_async_session() -> AsyncSession:
+    # Objects must stay readable after commit: lazy refresh is not possible under asyncio
+    return AsyncSession(async_engine, expire_on_commit=False)
+
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
-    session = Session(engine)
+    """Session with its own transaction: committed on success, rolled back on error"""
+    session = new_session()
+
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session with its own transaction: committed on success, rolled back on error"""
+    session = new_async_session()
 
     try:
         yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
     finally:
-        session.close()
\ No newline at end of file
+        await session.close()
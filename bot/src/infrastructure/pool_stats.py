@@ -0,0 +1,116 @@
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+# Upper bounds of checkout latency buckets, in milliseconds. The last bucket is unbounded.
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    pool_size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    checkout_latency_ms: dict[str, int]
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class PoolMonitor:
+    """Collects checkout latency for an engine's pool and reports live pool state.
+
+    Pool state (checked out, overflow) is read from `engine.pool` on every `snapshot`,
+    so the numbers stay correct after `engine.dispose()` replaces the pool.
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def record_checkout(self, seconds: float) -> None:
+        with self._lock:
+            self._bucket_counts[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+            self._checkouts += 1
+            self._total_wait += seconds
+            self._max_wait = max(self._max_wait, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> PoolStats:
+        pool = self._engine.pool
+
+        with self._lock:
+            labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+
+            return PoolStats(
+                pool_size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+                checkout_latency_ms=dict(zip(labels, self._bucket_counts)),
+            )
+
+
+class _MonitoredPoolMixin:
+    monitor: PoolMonitor | None = None
+
+    def connect(self):
+        started = time.perf_counter()
+
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.monitor:
+                self.monitor.record_timeout()
+            raise
+
+        if self.monitor:
+            self.monitor.record_checkout(time.perf_counter() - started)
+
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(_MonitoredPoolMixin, QueuePool):
+    pass
+
+
+class MonitoredAsyncAdaptedQueuePool(_MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def monitor_pool(engine: Engine) -> PoolMonitor:
+    """Attach a monitor to an engine created with one of the `Monitored*Pool` classes.
+
+    For async engines pass `async_engine.sync_engine`.
+    """
+    monitor = PoolMonitor(engine)
+    engine.pool.monitor = monitor
+    return monitor
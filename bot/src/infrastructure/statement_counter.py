@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class StatementCount:
+    statements: int = 0
+    sessions: int = 0
+
+
+class StatementCounter:
+    """Counts SQL statements and database sessions issued against an engine.
+
+        with StatementCounter(engine) as count:
+            repository.list_all()
+        assert count.statements <= 3
+
+    A session is counted when it starts using a connection of the engine, so sessions
+    that never touch the database are not counted. `executemany` counts as one statement.
+    For async engines pass `async_engine.sync_engine`.
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self.count = StatementCount()
+
+    def __enter__(self) -> StatementCount:
+        self.count = StatementCount()
+        event.listen(self._engine, "before_cursor_execute", self._on_statement)
+        event.listen(Session, "after_begin", self._on_session_begin)
+        return self.count
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_statement)
+        event.remove(Session, "after_begin", self._on_session_begin)
+
+    def _on_statement(self, connection, cursor, statement, parameters, context, executemany) -> None:
+        self.count.statements += 1
+
+    def _on_session_begin(self, session, transaction, connection) -> None:
+        if connection.engine is self._engine:
+            self.count.sessions += 1
@@ -0,0 +1,171 @@
+"""Composition root: wires adapters to services and runs the bot in the configured mode.
+
+    python -m src.main
+"""
+import asyncio
+import threading
+from dataclasses import asdict
+from datetime import timedelta
+
+import uvicorn
+from telegram import Update
+
+from src.adapters.inbound.telegram.admin import AdminHandler
+from src.adapters.inbound.telegram.application import build_application
+from src.adapters.inbound.telegram.buy import BuyHandler
+from src.adapters.inbound.telegram.callback_codec import CallbackCodec
+from src.adapters.inbound.telegram.inline_search import InlineSearchHandler
+from src.adapters.inbound.telegram.keyboards import CatalogKeyboards
+from src.adapters.inbound.telegram.menu import MenuHandler
+from src.adapters.inbound.telegram.sell import SellHandler
+from src.adapters.inbound.telegram.webhook import create_webhook_app
+from src.adapters.outbound.cache.course_repository import CachedCourseRepository
+from src.adapters.outbound.cache.invalidator import CatalogCacheInvalidator
+from src.adapters.outbound.cache.note_repository import CachedNoteRepository
+from src.adapters.outbound.cache.ttl_cache import TaggedTTLCache
+from src.adapters.outbound.content.welcome_message_store import FileWelcomeMessageStore
+from src.adapters.outbound.object_storage.local import LocalObjectStorage
+from src.adapters.outbound.persistence.async_note_repository import AsyncSqlModelNoteRepository
+from src.adapters.outbound.persistence.async_receipt_repository import AsyncSqlModelReceiptRepository
+from src.adapters.outbound.persistence.conversation_state_store import SqlModelConversationStateStore
+from src.adapters.outbound.persistence.course_repository import SqlModelCourseRepository
+from src.adapters.outbound.persistence.note_repository import SqlModelNoteRepository
+from src.adapters.outbound.persistence.receipt_journal import WriteBehindReceiptJournal
+from src.adapters.outbound.persistence.receipt_repository import SqlModelReceiptRepository
+from src.adapters.outbound.persistence.submission_repository import SqlModelSubmissionRepository
+from src.adapters.outbound.persistence.unit_of_work import SqlModelUnitOfWork
+from src.adapters.outbound.telegram.admin_digest import AdminDigestNotifier
+from src.adapters.outbound.telegram.send_scheduler import TelegramSendScheduler
+from src.core.application.services.admin_confirm import AdminConfirmService
+from src.core.application.services.admin_list_pending import AdminListPendingService
+from src.core.application.services.admin_release import AdminReleaseService
+from src.core.application.services.admin_update_welcome import AdminUpdateWelcomeService
+from src.core.application.services.buy_notes import BuyNotesService
+from src.core.application.services.search_catalog import SearchCatalogService
+from src.core.application.services.sell_notes import SellNotesService
+from src.core.application.services.start_interaction import StartInteractionService
+from src.infrastructure.config import settings
+from src.infrastructure.database import create_db_and_tables, get_async_session, get_pool_stats, get_session, new_session
+from src.infrastructure.logger import setup_logging
+
+
+def main() -> None:
+    setup_logging()
+    create_db_and_tables()
+
+    catalog_cache = TaggedTTLCache(settings.CATALOG_CACHE_MAX_SIZE, settings.CATALOG_CACHE_TTL_SECONDS)
+    course_repository = CachedCourseRepository(SqlModelCourseRepository(get_session), catalog_cache)
+    note_repository = CachedNoteRepository(SqlModelNoteRepository(get_session), catalog_cache)
+
+    receipt_journal = WriteBehindReceiptJournal(
+        SqlModelReceiptRepository(get_session),
+        settings.RECEIPT_JOURNAL_FLUSH_INTERVAL_SECONDS,
+        settings.RECEIPT_JOURNAL_MAX_BATCH,
+        settings.RECEIPT_JOURNAL_MAX_BUFFER,
+    )
+    receipt_journal.start()
+
+    conversation_state_store = SqlModelConversationStateStore(
+        get_session,
+        settings.CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS,
+        settings.CONVERSATION_STATE_MAX_BATCH,
+        timedelta(days=settings.CONVERSATION_STATE_MAX_AGE_DAYS),
+    )
+    conversation_state_store.load()
+    conversation_state_store.start()
+
+    welcome_message_store = FileWelcomeMessageStore(
+        settings.TELEGRAM_WELCOME_MESSAGE_PATH, settings.TELEGRAM_WELCOME_MESSAGE_DEFAULT
+    )
+    threading.Thread(target=welcome_message_store.watch, name="welcome-message-watcher", daemon=True).start()
+
+    search_service = SearchCatalogService(course_repository)
+    search_service.rebuild()
+    # Rotating the secret turns every button sent before into a stale one
+    codec = CallbackCodec((settings.TELEGRAM_CALLBACK_SECRET or settings.TELEGRAM_TOKEN).encode())
+    keyboards = CatalogKeyboards(course_repository, codec)
+    keyboards.rebuild()
+
+    polling = settings.TELEGRAM_MODE == "polling"
+
+    async def startup(_) -> None:
+        admin_digest.start()
+
+    async def shutdown(_) -> None:
+        await admin_digest.close()
+        await send_scheduler.close()
+        await asyncio.to_thread(receipt_journal.close)
+        await asyncio.to_thread(conversation_state_store.close)
+
+    application = build_application(
+        settings.TELEGRAM_TOKEN, settings.TELEGRAM_CONCURRENT_UPDATES, polling, post_init=startup, post_stop=shutdown
+    )
+    send_scheduler = TelegramSendScheduler(application.bot)
+    admin_digest = AdminDigestNotifier(
+        send_scheduler, settings.TELEGRAM_ADMIN_ID, course_repository, settings.ADMIN_DIGEST_WINDOW_SECONDS
+    )
+
+    object_storage = LocalObjectStorage(settings.OBJECT_STORAGE_ROOT)
+    release_service = AdminReleaseService(
+        AsyncSqlModelReceiptRepository(get_async_session),
+        AsyncSqlModelNoteRepository(get_async_session),
+        object_storage,
+        send_scheduler,
+        settings.ADMIN_RELEASE_CONCURRENCY,
+    )
+    unit_of_work = lambda: SqlModelUnitOfWork(new_session)
+    sell_service = SellNotesService(unit_of_work, object_storage, settings.UPLOAD_MAX_FILE_SIZE, [admin_digest])
+    # Confirmed notes show up in search, menus and cached reads without a restart
+    confirm_service = AdminConfirmService(
+        unit_of_work, [search_service, keyboards, CatalogCacheInvalidator(catalog_cache)]
+    )
+
+    application.add_handlers([
+        *AdminHandler(
+            settings.TELEGRAM_ADMIN_ID,
+            AdminUpdateWelcomeService(welcome_message_store),
+            release_service,
+            AdminListPendingService(SqlModelSubmissionRepository(get_session)),
+            confirm_service,
+            send_scheduler,
+        ).handlers(),
+        *MenuHandler(StartInteractionService(welcome_message_store), keyboards, codec, send_scheduler).handlers(),
+        *BuyHandler(
+            BuyNotesService(course_repository, note_repository, receipt_journal, [admin_digest]),
+            keyboards,
+            codec,
+            send_scheduler,
+            settings.PAYMENT_DETAILS,
+            settings.NOTE_PRICE_RUB,
+        ).handlers(),
+        *SellHandler(sell_service, codec, send_scheduler, conversation_state_store).handlers(),
+        InlineSearchHandler(search_service).handler(),
+    ])
+
+    if polling:
+        application.run_polling(allowed_updates=Update.ALL_TYPES)
+        return
+
+    webhook_app = create_webhook_app(
+        application,
+        secret_token=settings.TELEGRAM_WEBHOOK_SECRET,
+        path=settings.TELEGRAM_WEBHOOK_PATH,
+        webhook_url=settings.TELEGRAM_WEBHOOK_URL,
+        stats=lambda: {
+            "send_queue": asdict(send_scheduler.stats()),
+            "db_pools": {name: asdict(stats) for name, stats in get_pool_stats().items()},
+        },
+    )
+    # log_config=None keeps the logging configured by setup_logging
+    uvicorn.run(
+        webhook_app,
+        host=settings.TELEGRAM_WEBHOOK_HOST,
+        port=settings.TELEGRAM_WEBHOOK_PORT,
+        loop="uvloop",
+        http="httptools",
+        log_config=None,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compares memory held by catalog reads with plain dataclasses and with the slotted, interned models.
+
+Rows are built in memory and decoded again for every read, like a database driver would,
+so the numbers cover only the domain objects that repositories hand out and caches keep.
+
+    python -m tools.benchmark_model_memory --subjects 300 --notes 50 --reads 3
+"""
+import argparse
+import gc
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+
+from src.adapters.outbound.persistence.mappers import catalog_to_domain
+from src.core.domain.common.enums import CourseYear
+from src.core.domain.common.facades import uuid7
+
+
+# The models as they were before they became slotted and immutable
+@dataclass(kw_only=True)
+class PlainBaseModel:
+    id: uuid.UUID = field(default_factory=uuid7)
+
+
+@dataclass
+class PlainNote(PlainBaseModel):
+    title: str
+    file_key: str | None = None
+    telegram_file_id: str | None = None
+
+
+@dataclass
+class PlainSubject(PlainBaseModel):
+    name: str
+    notes: list[PlainNote]
+
+
+@dataclass
+class PlainCourse(PlainBaseModel):
+    year: CourseYear
+    subjects: list[PlainSubject]
+
+
+def plain_catalog_to_domain(course_rows, subject_rows, note_rows) -> list[PlainCourse]:
+    courses = [PlainCourse(id=course_id, year=CourseYear(year), subjects=[]) for course_id, year in course_rows]
+    courses_by_id = {course.id: course for course in courses}
+
+    subjects_by_id = {}
+    for subject_id, name, course_id in subject_rows:
+        subject = PlainSubject(id=subject_id, name=name, notes=[])
+        subjects_by_id[subject_id] = subject
+        courses_by_id[course_id].subjects.append(subject)
+
+    for note_id, title, file_key, telegram_file_id, subject_id in note_rows:
+        subjects_by_id[subject_id].notes.append(
+            PlainNote(id=note_id, title=title, file_key=file_key, telegram_file_id=telegram_file_id)
+        )
+
+    return courses
+
+
+def catalog_rows(subjects_per_course: int, notes_per_subject: int):
+    courses = [(uuid7(), year.value) for year in CourseYear]
+    subjects = [(uuid7(), f"Subject {year}.{s}", course_id) for course_id, year in courses for s in range(subjects_per_course)]
+    notes = [
+        (uuid7(), f"Lecture notes {name} #{n}", f"{subject_id.hex}-{n}", None, subject_id)
+        for subject_id, name, _ in subjects
+        for n in range(notes_per_subject)
+    ]
+    return courses, subjects, notes
+
+
+def fetch(rows):
+    """Fresh ids and strings for every read, as returned by a driver"""
+    courses, subjects, notes = rows
+    return (
+        [(uuid.UUID(bytes=course_id.bytes), year) for course_id, year in courses],
+        [(uuid.UUID(bytes=subject_id.bytes), name.encode().decode(), uuid.UUID(bytes=course_id.bytes))
+         for subject_id, name, course_id in subjects],
+        [(uuid.UUID(bytes=note_id.bytes), title.encode().decode(), file_key.encode().decode(), telegram_file_id,
+          uuid.UUID(bytes=subject_id.bytes))
+         for note_id, title, file_key, telegram_file_id, subject_id in notes],
+    )
+
+
+def measure(mapper, rows, reads: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+
+    for _ in range(reads):
+        fetched = fetch(rows)
+        kept.append(mapper(*fetched))
+        del fetched
+        gc.collect()
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark memory held by cached catalog reads")
+    parser.add_argument("--subjects", type=int, default=300, help="subjects per course")
+    parser.add_argument("--notes", type=int, default=50, help="notes per subject")
+    parser.add_argument("--reads", type=int, default=3, help="catalog reads kept alive, e.g. by caches")
+    args = parser.parse_args()
+
+    rows = catalog_rows(args.subjects, args.notes)
+    print(f"{len(rows[1])} subjects, {len(rows[2])} notes, {args.reads} reads kept")
+
+    plain = measure(plain_catalog_to_domain, rows, args.reads)
+    interned = measure(catalog_to_domain, rows, args.reads)
+
+    print(f"plain dataclasses:  {plain / 2 ** 20:8.1f} MiB")
+    print(f"slotted + interned: {interned / 2 ** 20:8.1f} MiB ({interned / plain:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""Fails when a repository method or use case issues more SQL than its recorded budget.
+
+Every scenario runs against a SQLite catalog seeded at a small and a large size; the
+async repositories are measured on the same database through aiosqlite. The budget is recorded from the small run, and the large run may not issue more
+statements than the small one, so a query count that grows with the number of subjects
+or notes (an N+1) fails the check even if the small run fits the budget. Known, bounded
+growth is listed in `ALLOWED_GROWTH`.
+
+    python -m tools.check_query_budgets           # check, exit code 1 on regressions
+    python -m tools.check_query_budgets --record  # rewrite budgets after an intended change
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import pathlib
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from functools import partial
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.adapters.outbound.persistence.async_course_repository import AsyncSqlModelCourseRepository
+from src.adapters.outbound.persistence.async_note_repository import AsyncSqlModelNoteRepository
+from src.adapters.outbound.persistence.async_receipt_repository import AsyncSqlModelReceiptRepository
+from src.adapters.outbound.persistence.async_subject_repository import AsyncSqlModelSubjectRepository
+from src.adapters.outbound.persistence.course_repository import SqlModelCourseRepository
+from src.adapters.outbound.persistence.note_repository import SqlModelNoteRepository
+from src.adapters.outbound.persistence.receipt_journal import WriteBehindReceiptJournal
+from src.adapters.outbound.persistence.receipt_repository import SqlModelReceiptRepository
+from src.adapters.outbound.persistence.subject_repository import SqlModelSubjectRepository
+from src.adapters.outbound.persistence.submission_repository import SqlModelSubmissionRepository
+from src.adapters.outbound.persistence.unit_of_work import SqlModelUnitOfWork
+from src.core.application.services.admin_confirm import AdminConfirmService
+from src.core.application.services.admin_list_pending import AdminListPendingService
+from src.core.application.services.buy_notes import BuyNotesService
+from src.core.application.services.sell_notes import SellNotesService
+from src.core.domain.common.enums import CourseYear
+from src.core.domain.models import Course, Note, Receipt, Subject, Submission
+from src.infrastructure.statement_counter import StatementCounter
+
+
+BUDGETS_PATH = pathlib.Path(__file__).parent / "query_budgets.json"
+
+# (subjects per course, notes per subject)
+SIZES = {"small": (2, 2), "large": (40, 15)}
+
+# Extra statements the large run may issue over the small one
+ALLOWED_GROWTH = {
+    # selectinload fetches the notes in IN batches of 500, the large catalog has 600 receipts
+    "ReceiptRepository.get_many": 1,
+    "AsyncReceiptRepository.get_many": 1,
+}
+
+
+class Catalog:
+    """Fresh database seeded with a catalog of the given size; `close` removes it"""
+
+    def __init__(self, subjects_per_course: int, notes_per_subject: int):
+        # A file rather than memory, so the async engine sees the same data
+        self._directory = tempfile.TemporaryDirectory()
+        path = pathlib.Path(self._directory.name) / "catalog.db"
+        self.engine = create_engine(f"sqlite:///{path}")
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        SQLModel.metadata.create_all(self.engine)
+
+        self.courses = [
+            Course(
+                year=year,
+                subjects=tuple(
+                    Subject(name=f"Subject {year.value}.{s}", notes=tuple(
+                        Note(title=f"Note {year.value}.{s}.{n}", file_key=f"{year.value}-{s}-{n}")
+                        for n in range(notes_per_subject)
+                    ))
+                    for s in range(subjects_per_course)
+                ),
+            )
+            for year in CourseYear
+        ]
+        self.course_repository.save_many(self.courses)
+
+        self.course = self.courses[0]
+        self.subject = self.course.subjects[0]
+        self.note = self.subject.notes[0]
+
+        self.receipts = [
+            Receipt(buyer_id=1, buyer_name="Buyer", payment_credentials="card", price_rub=100, note=note)
+            for subject in self.course.subjects
+            for note in subject.notes
+        ]
+        for receipt in self.receipts:
+            self.receipt_repository.save(receipt)
+
+        self.submissions = [
+            Submission(uploader_id=2, uploader_name="Seller", subject_id=subject.id, title=f"Upload {i}",
+                       payment_details="card", file_key=f"upload-{i}")
+            for i, subject in enumerate(self.course.subjects)
+        ]
+        for submission in self.submissions:
+            self.submission_repository.save(submission)
+
+    @contextlib.contextmanager
+    def get_session(self):
+        session = Session(self.engine)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @contextlib.asynccontextmanager
+    async def get_async_session(self):
+        session = AsyncSession(self.async_engine, expire_on_commit=False)
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    def close(self) -> None:
+        self.engine.dispose()
+        self._directory.cleanup()
+
+    def unit_of_work(self) -> SqlModelUnitOfWork:
+        return SqlModelUnitOfWork(partial(Session, self.engine))
+
+    @property
+    def course_repository(self):
+        return SqlModelCourseRepository(self.get_session)
+
+    @property
+    def subject_repository(self):
+        return SqlModelSubjectRepository(self.get_session)
+
+    @property
+    def note_repository(self):
+        return SqlModelNoteRepository(self.get_session)
+
+    @property
+    def receipt_repository(self):
+        return SqlModelReceiptRepository(self.get_session)
+
+    @property
+    def submission_repository(self):
+        return SqlModelSubmissionRepository(self.get_session)
+
+    @property
+    def async_course_repository(self):
+        return AsyncSqlModelCourseRepository(self.get_async_session)
+
+    @property
+    def async_subject_repository(self):
+        return AsyncSqlModelSubjectRepository(self.get_async_session)
+
+    @property
+    def async_note_repository(self):
+        return AsyncSqlModelNoteRepository(self.get_async_session)
+
+    @property
+    def async_receipt_repository(self):
+        return AsyncSqlModelReceiptRepository(self.get_async_session)
+
+    @property
+    def buy_notes_service(self) -> BuyNotesService:
+        # The journal is never flushed here: the scenario measures the purchase itself
+        return BuyNotesService(self.course_repository, self.note_repository, WriteBehindReceiptJournal(self.receipt_repository))
+
+
+def _resaved_course(c: Catalog) -> Course:
+    renamed = replace(c.subject, name=c.subject.name + " (renamed)")
+    return replace(c.course, subjects=(renamed, *c.course.subjects[1:]))
+
+
+def _resaved_subject(c: Catalog) -> Subject:
+    return replace(c.subject, notes=(*c.subject.notes, Note(title="New note")))
+
+
+SCENARIOS: dict[str, Callable[[Catalog], object]] = {
+    "CourseRepository.get_by_id": lambda c: c.course_repository.get_by_id(c.course.id),
+    "CourseRepository.get_by_year": lambda c: c.course_repository.get_by_year(c.course.year),
+    "CourseRepository.list_all": lambda c: c.course_repository.list_all(),
+    "CourseRepository.save": lambda c: c.course_repository.save(_resaved_course(c)),
+    "CourseRepository.save_many": lambda c: c.course_repository.save_many(c.courses),
+    "CourseRepository.delete": lambda c: c.course_repository.delete(c.courses[-1].id),
+    "SubjectRepository.get_by_id": lambda c: c.subject_repository.get_by_id(c.subject.id),
+    "SubjectRepository.get_by_name": lambda c: c.subject_repository.get_by_name(c.subject.name),
+    "SubjectRepository.save": lambda c: c.subject_repository.save(_resaved_subject(c)),
+    "SubjectRepository.save_many": lambda c: c.subject_repository.save_many(c.course.id, c.course.subjects),
+    "SubjectRepository.delete": lambda c: c.subject_repository.delete(c.courses[-1].subjects[-1].id),
+    "NoteRepository.get_by_id": lambda c: c.note_repository.get_by_id(c.note.id),
+    "NoteRepository.get_by_title": lambda c: c.note_repository.get_by_title(c.note.title),
+    "NoteRepository.save": lambda c: c.note_repository.save(c.note),
+    "NoteRepository.save_many": lambda c: c.note_repository.save_many(c.subject.id, c.subject.notes),
+    "NoteRepository.set_telegram_file_id": lambda c: c.note_repository.set_telegram_file_id(c.note.id, "file"),
+    "ReceiptRepository.get_by_id": lambda c: c.receipt_repository.get_by_id(c.receipts[0].id),
+    "ReceiptRepository.get_many": lambda c: c.receipt_repository.get_many([receipt.id for receipt in c.receipts]),
+    "ReceiptRepository.get_by_buyer_id": lambda c: c.receipt_repository.get_by_buyer_id(1),
+    "ReceiptRepository.list_by_buyer": lambda c: c.receipt_repository.list_by_buyer(1, limit=20),
+    "ReceiptRepository.save": lambda c: c.receipt_repository.save(c.receipts[0]),
+    "ReceiptRepository.save_many": lambda c: c.receipt_repository.save_many(c.receipts),
+    "SubmissionRepository.list_pending": lambda c: c.submission_repository.list_pending(limit=20),
+    "BuyNotesService.get_courses": lambda c: c.buy_notes_service.get_courses(),
+    "BuyNotesService.create_purchase_receipt": lambda c: c.buy_notes_service
+        .create_purchase_receipt(1, "Buyer", "card", 100, c.note.id),
+    "AdminListPendingService.list_pending": lambda c: AdminListPendingService(c.submission_repository).list_pending(),
+    "AdminListPendingService.list_pending (next page)": lambda c: AdminListPendingService(c.submission_repository, 1)
+        .list_pending(after=c.submissions[0].id),
+    "AdminConfirmService.confirm": lambda c: AdminConfirmService(c.unit_of_work).confirm(c.submissions[0].id),
+    # Submitting does not touch the object storage, the file is uploaded before
+    "SellNotesService.submit": lambda c: SellNotesService(c.unit_of_work, None, 0)
+        .submit(1, "Seller", c.subject.id, "Upload", "card", "0" * 64),
+}
+
+ASYNC_SCENARIOS: dict[str, Callable[[Catalog], Awaitable[object]]] = {
+    "AsyncCourseRepository.get_by_id": lambda c: c.async_course_repository.get_by_id(c.course.id),
+    "AsyncCourseRepository.get_by_year": lambda c: c.async_course_repository.get_by_year(c.course.year),
+    "AsyncCourseRepository.list_all": lambda c: c.async_course_repository.list_all(),
+    "AsyncCourseRepository.save": lambda c: c.async_course_repository.save(_resaved_course(c)),
+    "AsyncCourseRepository.save_many": lambda c: c.async_course_repository.save_many(c.courses),
+    "AsyncCourseRepository.delete": lambda c: c.async_course_repository.delete(c.courses[-1].id),
+    "AsyncSubjectRepository.get_by_id": lambda c: c.async_subject_repository.get_by_id(c.subject.id),
+    "AsyncSubjectRepository.get_by_name": lambda c: c.async_subject_repository.get_by_name(c.subject.name),
+    "AsyncSubjectRepository.save": lambda c: c.async_subject_repository.save(_resaved_subject(c)),
+    "AsyncSubjectRepository.save_many": lambda c: c.async_subject_repository.save_many(c.course.id, c.course.subjects),
+    "AsyncSubjectRepository.delete": lambda c: c.async_subject_repository.delete(c.courses[-1].subjects[-1].id),
+    "AsyncNoteRepository.get_by_id": lambda c: c.async_note_repository.get_by_id(c.note.id),
+    "AsyncNoteRepository.get_by_title": lambda c: c.async_note_repository.get_by_title(c.note.title),
+    "AsyncNoteRepository.save": lambda c: c.async_note_repository.save(c.note),
+    "AsyncNoteRepository.save_many": lambda c: c.async_note_repository.save_many(c.subject.id, c.subject.notes),
+    "AsyncNoteRepository.set_telegram_file_id": lambda c: c.async_note_repository.set_telegram_file_id(c.note.id, "file"),
+    "AsyncReceiptRepository.get_by_id": lambda c: c.async_receipt_repository.get_by_id(c.receipts[0].id),
+    "AsyncReceiptRepository.get_many": lambda c: c.async_receipt_repository
+        .get_many([receipt.id for receipt in c.receipts]),
+    "AsyncReceiptRepository.get_by_buyer_id": lambda c: c.async_receipt_repository.get_by_buyer_id(1),
+    "AsyncReceiptRepository.list_by_buyer": lambda c: c.async_receipt_repository.list_by_buyer(1, limit=20),
+    "AsyncReceiptRepository.save": lambda c: c.async_receipt_repository.save(c.receipts[0]),
+    "AsyncReceiptRepository.save_many": lambda c: c.async_receipt_repository.save_many(c.receipts),
+}
+
+
+def measure() -> dict[str, dict[str, dict[str, int]]]:
+    results = {}
+
+    for name, scenario in SCENARIOS.items():
+        results[name] = {}
+        for size, (subjects, notes) in SIZES.items():
+            catalog = Catalog(subjects, notes)
+            try:
+                with StatementCounter(catalog.engine) as count:
+                    scenario(catalog)
+            finally:
+                catalog.close()
+            results[name][size] = {"statements": count.statements, "sessions": count.sessions}
+
+    for name, scenario in ASYNC_SCENARIOS.items():
+        results[name] = {}
+        for size, (subjects, notes) in SIZES.items():
+            catalog = Catalog(subjects, notes)
+            try:
+                count = asyncio.run(_measure_async(catalog, scenario))
+            finally:
+                catalog.close()
+            results[name][size] = {"statements": count.statements, "sessions": count.sessions}
+
+    return results
+
+
+async def _measure_async(catalog: Catalog, scenario: Callable[[Catalog], Awaitable[object]]):
+    try:
+        # Connect first, so the count does not depend on whether the pool was warm
+        async with catalog.async_engine.connect():
+            pass
+        with StatementCounter(catalog.async_engine.sync_engine) as count:
+            await scenario(catalog)
+        return count
+    finally:
+        # Disposed on the loop that opened the connections, or aiosqlite's threads keep the process alive
+        await catalog.async_engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check SQL statement budgets of repositories and use cases")
+    parser.add_argument("--record", action="store_true", help="store current counts as the new budgets")
+    args = parser.parse_args()
+
+    results = measure()
+
+    if args.record:
+        budgets = {name: dict(runs["small"]) for name, runs in results.items()}
+        BUDGETS_PATH.write_text(json.dumps(budgets, indent=2) + "\n")
+        print(f"Recorded {len(budgets)} budgets to {BUDGETS_PATH}")
+        return 0
+
+    budgets = json.loads(BUDGETS_PATH.read_text())
+    failures = []
+
+    for name, runs in results.items():
+        budget = budgets.get(name)
+        if budget is None:
+            failures.append(f"{name}: no budget recorded")
+            continue
+
+        for metric, value in runs["small"].items():
+            if value > budget[metric]:
+                failures.append(f"{name} [small]: {value} {metric}, budget {budget[metric]}")
+
+        for metric, value in runs["large"].items():
+            allowed = runs["small"][metric] + (ALLOWED_GROWTH.get(name, 0) if metric == "statements" else 0)
+            if value > allowed:
+                failures.append(f"{name} [large]: {value} {metric}, {allowed} allowed by the small run")
+
+    for name, runs in results.items():
+        counts = ", ".join(f"{size} {run['statements']}q/{run['sessions']}s" for size, run in runs.items())
+        print(f"{'FAIL' if any(f.startswith(name + ' ') for f in failures) else 'ok  '} {name}: {counts}")
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())